@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
 import hmac
 import json
 import logging
 import os
-import re
 from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import NamedTuple
 
 import sys
 import yaml
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 import plotly.graph_objects as go
 import streamlit as st
 
@@ -26,6 +30,8 @@ ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
 CONFIG_PATH = ROOT / "config" / "hotels.yaml"
 AUDIT_LOG = DATA_DIR / "audit.csv"
+# Derived from the score CSVs by load_all_history; safe to delete.
+HISTORY_CACHE_PATH = DATA_DIR / "history.parquet"
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +43,10 @@ SOURCES = {
     "HolidayCheck": DATA_DIR / "holidaycheck_scores.csv",
 }
 
+# Fixed category set, so every source's history shares one dtype and concat
+# keeps integer codes instead of falling back to object.
+SOURCE_CAT = pd.CategoricalDtype(sorted(SOURCES))
+
 SCALE_MAX = {
     "Booking": 10.0,
     "Tripadvisor": 5.0,
@@ -78,28 +88,142 @@ HOLIDAYCHECK_REVIEWS_JSON_PATH = DATA_DIR / "holidaycheck_reviews.json"
 EXPEDIA_REVIEWS_JSON_PATH = DATA_DIR / "expedia_reviews.json"
 
 
-def load_source_df(path: Path) -> pd.DataFrame | None:
+def _read_scores_csv(path: Path, **kwargs) -> pd.DataFrame:
+    """``pd.read_csv`` for the ``;``-separated score files, on the pyarrow engine when available."""
+    try:
+        return pd.read_csv(path, sep=";", engine="pyarrow", **kwargs)
+    except ImportError:
+        return pd.read_csv(path, sep=";", **kwargs)
+
+
+@st.cache_data(show_spinner=False, max_entries=2 * len(SOURCES))
+def load_source_df(path: str, mtime: float) -> pd.DataFrame | None:
+    """Load one score CSV.
+
+    ``mtime`` is not used directly: it is part of the cache key so that a
+    rerun only re-parses the file after it changed on disk (e.g. after
+    ``set_manual_score`` wrote to it).  Every save therefore leaves an entry
+    for the old mtime behind; ``max_entries`` lets those age out.
+    """
+    return _read_source_csv(path, mtime)
+
+
+def _read_source_csv(path: str, mtime: float) -> pd.DataFrame | None:
+    """Uncached body of ``load_source_df``; safe to call from worker threads.
+
+    Reads the Parquet sidecar (see ``_sidecar_path``) when it is at least as
+    new as the CSV, otherwise parses the CSV and refreshes the sidecar.
+    """
+    path = Path(path)
     if not path.exists():
         return None
-    df = pd.read_csv(path, sep=";")
-    if "Hotel" not in df.columns:
-        return None
-    df["Hotel"] = df["Hotel"].astype(str).str.strip()
-    df = df.groupby("Hotel", as_index=False).first()
+    sidecar = _sidecar_path(path)
+    df = _read_sidecar(sidecar, path.stat().st_mtime)
+    if df is None:
+        header = pd.read_csv(path, sep=";", nrows=0)
+        if "Hotel" not in header.columns:
+            return None
+        # Parse scores once, as float32, so later passes never need pd.to_numeric.
+        date_cols = _parse_date_columns(header.columns)[0]
+        try:
+            df = _read_scores_csv(path, dtype=dict.fromkeys(date_cols, "float32"))
+        except ValueError:
+            df = _read_scores_csv(path)
+            df[date_cols] = df[date_cols].apply(pd.to_numeric, errors="coerce").astype("float32")
+        df["Hotel"] = df["Hotel"].astype(str).str.strip()
+        df = df.groupby("Hotel", as_index=False).first()
+        # A handful of names: categorical keeps them as small codes (and the
+        # sidecar stores them dictionary-encoded).
+        df["Hotel"] = df["Hotel"].astype("category")
+        _write_sidecar(df, sidecar)
+    elif not isinstance(df["Hotel"].dtype, pd.CategoricalDtype):
+        df["Hotel"] = df["Hotel"].astype("category")  # sidecar from before the cast
+    df.attrs["mtime"] = mtime
+    df.attrs["date_cols"], df.attrs["parsed_dates"] = _parse_date_columns(df.columns)
     return df
 
 
-DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+def _sidecar_path(csv_path: Path) -> Path:
+    """Parquet copy of a score CSV (``x_scores.csv`` -> ``x_scores.parquet``).
+
+    The CSV stays canonical: the scrapers and the workflow only know about it,
+    so a sidecar older than its CSV is ignored.
+    """
+    return csv_path.with_suffix(".parquet")
+
+
+def _read_sidecar(sidecar: Path, csv_mtime: float) -> pd.DataFrame | None:
+    try:
+        if sidecar.stat().st_mtime < csv_mtime:
+            return None
+        return pd.read_parquet(sidecar, engine="pyarrow")
+    except (OSError, ImportError, ValueError):
+        return None
+
+
+def _write_sidecar(df: pd.DataFrame, sidecar: Path) -> None:
+    """Best-effort Parquet write of a cleaned source frame."""
+    table = df.copy(deep=False)
+    table.attrs = {}  # attrs go into the Parquet metadata as JSON
+    tmp_path = sidecar.with_suffix(".parquet.tmp")
+    try:
+        table.to_parquet(tmp_path, engine="pyarrow", compression="snappy", index=False)
+        os.replace(tmp_path, sidecar)
+    except (OSError, ImportError, ValueError) as exc:
+        logger.warning("Could not write %s: %s", sidecar, exc)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _parse_date_columns(columns) -> tuple[list[str], tuple[np.datetime64, ...]]:
+    """Return the ``YYYY-MM-DD`` column names (file order) and their parsed dates."""
+    names, dates = _date_cols_for(tuple(columns))
+    return list(names), dates
+
+
+@functools.lru_cache(maxsize=32)
+def _date_cols_for(columns: tuple) -> tuple[tuple[str, ...], tuple[np.datetime64, ...]]:
+    """Memoized body of ``_parse_date_columns``; the same headers recur on every rerun."""
+    # Cheap shape check first: it keeps "Hotel"/"Average Score" away from the
+    # parser and rejects non-padded names like "2026-3-2" that %Y-%m-%d accepts.
+    cols = pd.Index([
+        c for c in columns
+        if isinstance(c, str) and len(c) == 10 and c[4] == c[7] == "-"
+        and (c[:4] + c[5:7] + c[8:]).isdigit()
+    ], dtype=object)
+    parsed = pd.to_datetime(cols, format="%Y-%m-%d", errors="coerce")
+    mask = parsed.notna()
+    # A tuple, not an ndarray: pandas compares attrs with == when propagating them.
+    return tuple(cols[mask]), tuple(parsed[mask].to_numpy())
+
+
+def _date_columns(df: pd.DataFrame) -> list[str]:
+    """Date columns of ``df``, taken from ``df.attrs`` when load_source_df set them."""
+    if "date_cols" in df.attrs:
+        return df.attrs["date_cols"]
+    return _parse_date_columns(df.columns)[0]
 
 
 def source_date_columns(df: pd.DataFrame) -> list[str]:
-    return sorted([c for c in df.columns if DATE_COL_RE.fullmatch(str(c))])
+    return sorted(_date_columns(df))
+
+
+def _row_nanmean(mat: np.ndarray) -> np.ndarray:
+    """Per-row mean ignoring NaN; all-NaN rows give NaN (without np.nanmean's warning)."""
+    present = ~np.isnan(mat)
+    counts = present.sum(axis=1)
+    totals = np.where(present, mat, 0.0).sum(axis=1)
+    out = np.full(len(mat), np.nan)
+    np.divide(totals, counts, out=out, where=counts > 0)
+    return out
 
 
 def update_average(df: pd.DataFrame) -> pd.DataFrame:
     date_cols = source_date_columns(df)
     if date_cols:
-        df["Average Score"] = pd.to_numeric(df[date_cols].stack(), errors="coerce").groupby(level=0).mean().round(2)
+        scores = df[date_cols]
+        if not all(pd.api.types.is_numeric_dtype(t) for t in scores.dtypes):
+            scores = scores.apply(pd.to_numeric, errors="coerce")
+        df["Average Score"] = _row_nanmean(scores.to_numpy(dtype=np.float64, na_value=np.nan)).round(2)
     return df
 
 
@@ -121,7 +245,20 @@ def _append_audit(source: str, hotel: str, date_col: str, old_value: object, new
         ])
 
 
-def set_manual_score(source: str, hotel: str, date_col: str, score: float) -> None:
+def set_manual_score(
+    source: str,
+    hotel: str,
+    date_col: str,
+    score: float,
+    src_df: pd.DataFrame | None = None,
+) -> None:
+    """Write one manual score to the source CSV.
+
+    ``src_df`` is the frame the dashboard already loaded for ``source``; it is
+    updated in place and written back as is, so only the edited hotel's
+    average is recomputed.  If the file changed on disk since that frame was
+    loaded (or no frame is given) the CSV is re-read first.
+    """
     import fcntl
 
     csv_path = SOURCES[source]
@@ -131,23 +268,36 @@ def set_manual_score(source: str, hotel: str, date_col: str, score: float) -> No
     with open(csv_path, "r") as lock_fh:
         fcntl.flock(lock_fh, fcntl.LOCK_EX)
         try:
-            df = pd.read_csv(csv_path, sep=";", index_col="Hotel")
-            df.index = df.index.astype(str).str.strip()
-            df = df.groupby(level=0).first()
+            mtime = csv_path.stat().st_mtime
+            df = src_df
+            if df is None or df.attrs.get("mtime") != mtime:
+                df = load_source_df(str(csv_path), mtime)
+            if df is None:
+                raise ValueError(f"{source}: no valid data file found.")
+
             hotel = hotel.strip()
-            if hotel not in df.index:
-                df.loc[hotel] = pd.NA
+            rows = df.index[df["Hotel"] == hotel]
+            if len(rows):
+                row = rows[0]
+            else:
+                row = df.index.max() + 1 if len(df) else 0
+                if isinstance(df["Hotel"].dtype, pd.CategoricalDtype):
+                    df["Hotel"] = df["Hotel"].cat.add_categories([hotel])
+                df.loc[row, "Hotel"] = hotel
 
             if date_col not in df.columns:
-                df[date_col] = pd.NA
+                df[date_col] = np.float32(np.nan)
+                df.attrs["date_cols"], df.attrs["parsed_dates"] = _parse_date_columns(df.columns)
 
-            old_value = df.loc[hotel, date_col] if hotel in df.index and date_col in df.columns else None
-            if pd.isna(old_value):
-                old_value = None
+            old_value = df.at[row, date_col]
+            old_value = None if pd.isna(old_value) else round(float(old_value), 4)
 
-            df.loc[hotel, date_col] = score
-            df = update_average(df)
-            df.to_csv(csv_path, sep=";", index_label="Hotel")
+            df.at[row, date_col] = score
+            row_scores = df.loc[[row], _date_columns(df)].to_numpy(dtype=np.float64, na_value=np.nan).round(4)
+            df.at[row, "Average Score"] = round(float(_row_nanmean(row_scores)[0]), 2)
+            with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as out:
+                df.to_csv(out, sep=";", index=False)
+            _write_sidecar(df, _sidecar_path(csv_path))
 
             _append_audit(source, hotel, date_col, old_value, score)
             logger.info("Manual score: %s | %s | %s | %s → %s", source, hotel, date_col, old_value, score)
@@ -156,20 +306,171 @@ def set_manual_score(source: str, hotel: str, date_col: str, score: float) -> No
 
 
 def scores_over_time(df: pd.DataFrame, source: str) -> pd.DataFrame:
-    date_cols = [c for c in df.columns if DATE_COL_RE.fullmatch(str(c))]
+    date_cols = _date_columns(df)
+    hotels = pd.Categorical(df["Hotel"])
     if not date_cols:
-        return pd.DataFrame(columns=["Hotel", "Source", "Date", "Score"])
+        return pd.DataFrame({
+            "Hotel": hotels[:0],
+            "Date": np.array([], dtype="datetime64[ns]"),
+            "Score": np.array([], dtype=np.float64),
+            "Source": pd.Categorical([], dtype=SOURCE_CAT),
+        })
 
-    long_df = df[["Hotel", *date_cols]].melt(
-        id_vars=["Hotel"],
-        value_vars=date_cols,
-        var_name="Date",
-        value_name="Score",
-    )
-    long_df["Source"] = source
-    long_df["Score"] = pd.to_numeric(long_df["Score"], errors="coerce")
-    long_df["Date"] = pd.to_datetime(long_df["Date"], errors="coerce")
-    return long_df.dropna(subset=["Date"])
+    # Same layout as ``melt`` (all hotels for the first date, then the next
+    # date, ...), built straight from the column buffers.  Dates go out in
+    # chronological order, so the combined history needs no global sort.
+    dates = df.attrs.get("parsed_dates")
+    if dates is None:
+        dates = _parse_date_columns(date_cols)[1]
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    date_cols = [date_cols[i] for i in order]
+    # Scores are float32 from load_source_df; rounding on the way back to
+    # float64 drops the float32 noise (8.7 -> 8.69999980927 -> 8.7).
+    values = df[date_cols].to_numpy(dtype=np.float64, na_value=np.nan).round(4).ravel(order="F")
+    # Only scored cells are kept, so consumers of the history never need to
+    # filter on Score.notna() themselves.
+    scored = ~np.isnan(values)
+    # Categoricals built from codes: no per-row string objects.
+    return pd.DataFrame({
+        "Hotel": pd.Categorical.from_codes(np.tile(hotels.codes, len(date_cols))[scored], dtype=hotels.dtype),
+        "Date": np.repeat(dates, len(hotels))[scored],
+        "Score": values[scored],
+        "Source": pd.Categorical.from_codes(
+            np.full(int(scored.sum()), SOURCE_CAT.categories.get_loc(source)), dtype=SOURCE_CAT
+        ),
+    })
+
+
+def _source_mtimes() -> tuple[tuple[str, float], ...]:
+    """``(source, mtime)`` for every source CSV (mtime 0.0 if missing): the load cache key."""
+    return tuple((source, p.stat().st_mtime if p.exists() else 0.0) for source, p in SOURCES.items())
+
+
+class SourceData(NamedTuple):
+    """Everything the page is rendered from, as one cached artifact."""
+
+    source_dfs: dict[str, pd.DataFrame]
+    history_df: pd.DataFrame | None
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_all_history(mtimes: tuple[tuple[str, float], ...]) -> SourceData:
+    """Load every source and build the combined long-format history.
+
+    ``history_df`` holds scored rows only and is ``None`` when no source has
+    data.  ``mtimes`` (see ``_source_mtimes``) only serves as the cache key,
+    so the history is rebuilt only after a CSV changes.  A fresh process
+    reads it back from ``HISTORY_CACHE_PATH`` when that file is newer than
+    every CSV.
+
+    ``history_df`` is sorted by ``(Source, Date)`` (stable, so hotels keep
+    their CSV order within a date).  The helpers below rely on that and
+    group with ``sort=False`` instead of re-sorting.
+    """
+    # The reads are independent and pandas parses without holding the GIL.
+    # Worker threads have no Streamlit script context, so they call the
+    # uncached reader; this whole function is cached instead.
+    sources = [source for source, _ in mtimes]
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as pool:
+        frames = pool.map(_read_source_csv, [str(SOURCES[s]) for s in sources], [m for _, m in mtimes])
+        source_dfs = {source: df for source, df in zip(sources, frames) if df is not None}
+    if not source_dfs:
+        return SourceData(source_dfs, None)
+
+    history_df = _read_history_cache(max(m for _, m in mtimes))
+    if history_df is not None:
+        history_df = history_df[history_df["Source"].isin(source_dfs)]
+        history_df = history_df.assign(Source=history_df["Source"].cat.remove_unused_categories())
+        return SourceData(source_dfs, history_df.reset_index(drop=True))
+
+    # A handful of hotel/source names repeated over every date: categoricals
+    # keep them as small integer codes for the filters and groupbys below.
+    # Sources share SOURCE_CAT and concat keeps it; hotel sets differ per
+    # source, so their categories are unioned rather than concatenated.
+    parts = [scores_over_time(df, source) for source, df in source_dfs.items()]
+    history_df = pd.concat([part.drop(columns="Hotel") for part in parts], ignore_index=True)
+    history_df.insert(0, "Hotel", union_categoricals([part["Hotel"] for part in parts], sort_categories=True))
+    # Each part is already chronological, so this only orders the sources.
+    history_df = history_df.sort_values(["Source", "Date"], kind="mergesort", ignore_index=True)
+    _write_history_cache(history_df)
+    return SourceData(source_dfs, history_df)
+
+
+def _read_history_cache(newest_csv_mtime: float) -> pd.DataFrame | None:
+    """Return the Parquet history if it is newer than all CSVs, else ``None``."""
+    try:
+        if HISTORY_CACHE_PATH.stat().st_mtime <= newest_csv_mtime:
+            return None
+        history_df = pd.read_parquet(HISTORY_CACHE_PATH)
+    except (OSError, ImportError, ValueError):
+        return None
+    # Stored as float32 (see _write_history_cache); the same round(4) used in
+    # scores_over_time restores the exact float64 values.
+    history_df["Score"] = history_df["Score"].astype(np.float64).round(4)
+    return history_df
+
+
+def _write_history_cache(history_df: pd.DataFrame) -> None:
+    """Best-effort write of the derived Parquet history (CSV stays canonical)."""
+    tmp_path = HISTORY_CACHE_PATH.with_suffix(".parquet.tmp")
+    try:
+        # Scores carry at most a few decimals, so float32 halves the column
+        # without losing anything round(4) cannot recover on read.
+        history_df.astype({"Score": np.float32}).to_parquet(
+            tmp_path, engine="pyarrow", compression="zstd", index=False
+        )
+        os.replace(tmp_path, HISTORY_CACHE_PATH)
+    except (OSError, ImportError, ValueError) as exc:
+        logger.warning("Could not write history cache %s: %s", HISTORY_CACHE_PATH, exc)
+        tmp_path.unlink(missing_ok=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def selection_views(
+    mtimes: tuple[tuple[str, float], ...],
+    sources: tuple[str, ...],
+) -> tuple[pd.DataFrame, dict[str, float | int]] | None:
+    """Scorecard and KPI for one source selection, or ``None`` if nothing is selected.
+
+    Keyed on the CSV mtimes and the selection itself, so going back to a
+    selection seen before is a cache hit.  Sources without any scores yet
+    give an empty scorecard rather than ``None``: the page still renders,
+    including the manual form used to fill them in.
+    """
+    history_df = load_all_history(mtimes).history_df
+    if history_df is None or not sources:
+        return None
+    selected = list(sources)
+    scorecard = latest_scorecard_table(history_df, selected)
+    return scorecard, ananea_competitive_index(history_df, selected, scorecard=scorecard)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def trend_figures(
+    mtimes: tuple[tuple[str, float], ...],
+    sources: tuple[str, ...],
+    year: int,
+) -> dict[str, go.Figure | None]:
+    """``source_year_figure`` for each source, cached like ``selection_views``.
+
+    Reruns triggered by other widgets (e.g. the manual-save form) reuse the
+    figures instead of rebuilding them.
+    """
+    history_df = load_all_history(mtimes).history_df
+    if history_df is None:
+        return dict.fromkeys(sources)
+    # One pass over the history for all charts instead of one filter each.
+    trends_df = history_df[
+        history_df["Source"].isin(sources).to_numpy()
+        & (history_df["Date"].dt.year == year).to_numpy()
+    ]
+    by_source = dict(tuple(trends_df.groupby("Source", sort=False, observed=True)))
+    return {
+        source: source_year_figure(by_source.get(source, trends_df.iloc[:0]), source, year)
+        for source in sources
+    }
 
 
 def latest_scorecard_table(history_df: pd.DataFrame, sources: list[str]) -> pd.DataFrame:
@@ -177,43 +478,43 @@ def latest_scorecard_table(history_df: pd.DataFrame, sources: list[str]) -> pd.D
         return pd.DataFrame()
 
     competitors = sorted([h for h in history_df["Hotel"].dropna().unique().tolist() if h != ANANEA_HOTEL])
+    hist = history_df[history_df["Source"].isin(sources)]
+    if hist.empty:
+        return pd.DataFrame()
+    source_key = hist["Source"].astype(str)
+
+    # Latest collection date per source and every hotel's score on it.
+    latest_date = hist.groupby(source_key, sort=False)["Date"].max()
+    latest = hist[hist["Date"].to_numpy() == source_key.map(latest_date).to_numpy()]
+    latest_scores = latest.set_index([latest["Source"].astype(str), latest["Hotel"].astype(str)])["Score"]
+
+    # Ananea delta vs the last Ananea value from a month before the latest
+    # date's month: the newest Ananea row dated before that month's first day.
+    month_start = latest_date.dt.to_period("M").dt.start_time
+    ananea = hist[hist["Hotel"] == ANANEA_HOTEL]
+    ananea_source = source_key[ananea.index]
+    before = ananea[ananea["Date"].to_numpy() < ananea_source.map(month_start).to_numpy()]
+    # Rows are date-ordered within a source, so ``last`` is the newest one.
+    prev_score = before.groupby(ananea_source[before.index], sort=False)["Score"].last()
+
     rows = []
     for source in sources:
-        src = history_df[(history_df["Source"] == source) & history_df["Score"].notna()]
-        if src.empty:
+        if source not in latest_date.index or (source, ANANEA_HOTEL) not in latest_scores.index:
             continue
-        unique_dates = sorted(src["Date"].unique())
-        latest_date = unique_dates[-1]
-
-        latest = src[src["Date"] == latest_date]
-        ananea = latest[latest["Hotel"] == ANANEA_HOTEL]
-        if ananea.empty:
-            continue
-
-        ananea_score = round(float(ananea["Score"].iloc[0]), 2)
-
-        # Compute Ananea delta vs the last value from a previous month.
-        # Walk backwards through dates until we find one whose month differs
-        # from latest_date's month.
+        ananea_score = round(float(latest_scores[(source, ANANEA_HOTEL)]), 2)
         ananea_delta = None
-        latest_month = (latest_date.year, latest_date.month)
-        for d in reversed(unique_dates[:-1]):
-            if (d.year, d.month) == latest_month:
-                continue
-            prev = src[(src["Date"] == d) & (src["Hotel"] == ANANEA_HOTEL)]
-            if not prev.empty:
-                ananea_delta = round(ananea_score - float(prev["Score"].iloc[0]), 2)
-                break
+        if source in prev_score.index:
+            ananea_delta = round(ananea_score - float(prev_score[source]), 2)
 
         row: dict[str, object] = {
             "Source": source,
-            "Date": latest_date.date().isoformat(),
+            "Date": latest_date[source].date().isoformat(),
             ANANEA_HOTEL: ananea_score,
             "Ananea \u0394": ananea_delta,
         }
         for competitor in competitors:
-            value = latest.loc[latest["Hotel"] == competitor, "Score"]
-            row[competitor] = round(float(value.iloc[0]), 2) if not value.empty else None
+            value = latest_scores.get((source, competitor))
+            row[competitor] = round(float(value), 2) if value is not None else None
         rows.append(row)
 
     return pd.DataFrame(rows)
@@ -279,40 +580,37 @@ def style_scorecard(df: pd.DataFrame) -> pd.io.formats.style.Styler:
     )
 
 
-def ananea_competitive_index(history_df: pd.DataFrame, sources: list[str]) -> dict[str, float | int]:
+def ananea_competitive_index(
+    history_df: pd.DataFrame,
+    sources: list[str],
+    scorecard: pd.DataFrame | None = None,
+) -> dict[str, float | int]:
     """
     KPI on 0-100 scale:
     - ananea_index: average normalized Ananea score across selected sources
     - peers_index: average normalized peers score across selected sources
     - edge_pp: Ananea advantage/disadvantage in percentage points
+
+    Pass ``scorecard`` (the ``latest_scorecard_table`` result for the same
+    inputs) to avoid building it a second time.
     """
-    rows = latest_scorecard_table(history_df, sources)
+    rows = scorecard if scorecard is not None else latest_scorecard_table(history_df, sources)
     if rows.empty:
         return {"ananea_index": float("nan"), "peers_index": float("nan"), "edge_pp": float("nan"), "sources_used": 0}
 
-    normalized = []
-    for _, row in rows.iterrows():
-        source = str(row["Source"])
-        scale = SCALE_MAX.get(source, 10.0)
-        ananea_score = row.get(ANANEA_HOTEL)
-        competitor_values = pd.to_numeric(
-            pd.Series([row[c] for c in rows.columns if c not in {"Source", "Date", ANANEA_HOTEL}]),
-            errors="coerce",
-        ).dropna()
-        peers_avg = competitor_values.mean() if not competitor_values.empty else float("nan")
-        if pd.isna(ananea_score):
-            continue
-        an = float(ananea_score) / float(scale) * 100.0
-        peers = float(peers_avg) / float(scale) * 100.0 if pd.notna(peers_avg) else float("nan")
-        normalized.append((an, peers))
-
-    if not normalized:
+    scale = rows["Source"].map(SCALE_MAX).fillna(10.0).to_numpy(dtype=float)
+    ananea_scores = pd.to_numeric(rows[ANANEA_HOTEL], errors="coerce").to_numpy(dtype=float)
+    peer_cols = [c for c in rows.columns if c not in {"Source", "Date", ANANEA_HOTEL}]
+    peers = rows[peer_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    keep = ~np.isnan(ananea_scores)
+    if not keep.any():
         return {"ananea_index": float("nan"), "peers_index": float("nan"), "edge_pp": float("nan"), "sources_used": 0}
 
-    an_values = [x[0] for x in normalized]
-    peers_values = [x[1] for x in normalized if pd.notna(x[1])]
-    ananea_index = sum(an_values) / len(an_values)
-    peers_index = sum(peers_values) / len(peers_values) if peers_values else float("nan")
+    an_values = ananea_scores[keep] / scale[keep] * 100.0
+    peers_values = _row_nanmean(peers[keep]) / scale[keep] * 100.0
+    peers_values = peers_values[~np.isnan(peers_values)]
+    ananea_index = float(an_values.mean())
+    peers_index = float(peers_values.mean()) if len(peers_values) else float("nan")
     edge_pp = ananea_index - peers_index if pd.notna(peers_index) else float("nan")
     return {
         "ananea_index": round(ananea_index, 2),
@@ -323,21 +621,22 @@ def ananea_competitive_index(history_df: pd.DataFrame, sources: list[str]) -> di
 
 
 def source_year_figure(history_df: pd.DataFrame, source: str, year: int) -> go.Figure | None:
-    src = history_df[(history_df["Source"] == source) & history_df["Score"].notna()].copy()
+    src = history_df[history_df["Source"] == source]
     if src.empty:
         return None
 
     min_date = pd.Timestamp(year, 1, 1)
     max_date = pd.Timestamp(year, 12, 31)
-    src = src[(src["Date"] >= min_date) & (src["Date"] <= max_date)].sort_values("Date")
+    src = src[(src["Date"] >= min_date) & (src["Date"] <= max_date)]
     if src.empty:
         return None
 
     fig = go.Figure()
-    competitors = sorted([h for h in src["Hotel"].dropna().unique().tolist() if h != ANANEA_HOTEL])
+    by_hotel = dict(tuple(src.groupby("Hotel", sort=False, observed=True)))
+    competitors = sorted(h for h in by_hotel if h != ANANEA_HOTEL)
     for hotel in [ANANEA_HOTEL, *competitors]:
-        hotel_df = src[src["Hotel"] == hotel]
-        if hotel_df.empty:
+        hotel_df = by_hotel.get(hotel)
+        if hotel_df is None:
             continue
         is_ananea = hotel == ANANEA_HOTEL
         fig.add_trace(
@@ -367,20 +666,23 @@ def missing_or_zero_rows(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
     if date_col not in df.columns:
         return pd.DataFrame(columns=["Hotel", "Issue", "Current Value"])
 
-    series = pd.to_numeric(df[date_col], errors="coerce")
-    missing_mask = series.isna()
-    zero_mask = series.eq(0)
-    flagged = df.loc[missing_mask | zero_mask, ["Hotel"]].copy()
-    if flagged.empty:
+    # Date columns are already float32 (see load_source_df): no coercion pass.
+    values = df[date_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    zero_mask = values == 0
+    flag_mask = zero_mask | np.isnan(values)
+    if not flag_mask.any():
         return pd.DataFrame(columns=["Hotel", "Issue", "Current Value"])
 
-    flagged["Issue"] = flagged.index.to_series().map(lambda idx: "Zero value" if bool(zero_mask.loc[idx]) else "Missing")
-    flagged["Current Value"] = series.loc[flagged.index].values
+    # Plain strings: a hotel added by a manual save sits at the end of the
+    # categories and would sort out of alphabetical order.
+    flagged = pd.DataFrame({"Hotel": df["Hotel"].to_numpy(dtype=object)[flag_mask]})
+    flagged["Issue"] = np.where(zero_mask[flag_mask], "Zero value", "Missing")
+    flagged["Current Value"] = values[flag_mask]
     return flagged.sort_values(["Issue", "Hotel"]).reset_index(drop=True)
 
 
 def manual_pending_summary(source_dfs: dict[str, pd.DataFrame]) -> pd.DataFrame:
-    rows: list[dict[str, object]] = []
+    parts: list[pd.DataFrame] = []
     for source, df in source_dfs.items():
         dates = source_date_columns(df)
         if not dates:
@@ -389,17 +691,11 @@ def manual_pending_summary(source_dfs: dict[str, pd.DataFrame]) -> pd.DataFrame:
         flagged = missing_or_zero_rows(df, latest_date)
         if flagged.empty:
             continue
-        for _, item in flagged.iterrows():
-            rows.append(
-                {
-                    "Source": source,
-                    "Date": latest_date,
-                    "Hotel": item["Hotel"],
-                    "Issue": item["Issue"],
-                    "Current Value": item["Current Value"],
-                }
-            )
-    return pd.DataFrame(rows)
+        parts.append(flagged.assign(Source=source, Date=latest_date))
+    if not parts:
+        return pd.DataFrame()
+    summary = pd.concat(parts, ignore_index=True)
+    return summary[["Source", "Date", "Hotel", "Issue", "Current Value"]]
 
 
 _TOPIC_DISPLAY = {
@@ -749,24 +1045,19 @@ def main() -> None:
     st.title("Hotel Reputation Dashboard")
     st.caption("Biweekly reputation scores over time, pulled from source websites.")
 
-    source_dfs: dict[str, pd.DataFrame] = {}
-    all_history = []
-    for source, path in SOURCES.items():
-        df = load_source_df(path)
-        if df is None:
+    mtimes = _source_mtimes()
+    source_dfs, history_df = load_all_history(mtimes)
+    for source in SOURCES:
+        if source not in source_dfs:
             st.warning(f"{source}: no valid data file found.")
-            continue
-        source_dfs[source] = df
-        all_history.append(scores_over_time(df, source))
 
-    if not all_history:
+    if history_df is None:
         st.error("No data available.")
         return
 
-    history_df = pd.concat(all_history, ignore_index=True)
-    history_df = history_df.sort_values("Date")
-
-    available_sources = sorted(history_df["Source"].dropna().unique().tolist())
+    # From the source frames, not the history: a source whose latest scrape
+    # failed everywhere still has no scored rows but should stay selectable.
+    available_sources = sorted(s for s, df in source_dfs.items() if len(df) and _date_columns(df))
     if "source_selector" not in st.session_state:
         st.session_state["source_selector"] = available_sources
     selected_sources = st.multiselect(
@@ -775,10 +1066,11 @@ def main() -> None:
         key="source_selector",
     )
 
-    filtered = history_df[history_df["Source"].isin(selected_sources)].copy()
-    if filtered.empty:
+    views = selection_views(mtimes, tuple(selected_sources))
+    if views is None:
         st.warning("No data for the selected filters.")
         return
+    scorecard, kpi = views
 
     # ================================================================== #
     # Competition Comparison
@@ -787,8 +1079,6 @@ def main() -> None:
 
     st.subheader("Ananea Scorecard")
     st.caption("Latest available score per source. Competitor values are red when higher than Ananea and green when lower.")
-    scorecard = latest_scorecard_table(history_df, selected_sources)
-    kpi = ananea_competitive_index(history_df, selected_sources)
 
     kpi_col1, kpi_col2, kpi_col3 = st.columns(3)
     with kpi_col1:
@@ -830,8 +1120,9 @@ def main() -> None:
 
     st.subheader(f"Source Trends ({trends_label})")
     st.caption("One chart per selected source. Points mark collection dates.")
+    figures = trend_figures(mtimes, tuple(selected_sources), trends_year)
     for source in selected_sources:
-        fig = source_year_figure(history_df, source, trends_year)
+        fig = figures[source]
         if fig is None:
             st.warning(f"{source}: no score history available for {trends_year}.")
             continue
@@ -893,7 +1184,13 @@ def main() -> None:
 
             if st.button("Save score", key="mv_save"):
                 try:
-                    set_manual_score(source=mv_source, hotel=hotel, date_col=selected_date, score=float(score))
+                    set_manual_score(
+                        source=mv_source,
+                        hotel=hotel,
+                        date_col=selected_date,
+                        score=float(score),
+                        src_df=mv_src_df,
+                    )
                     st.success(f"Saved {score:.1f} for {hotel} in {mv_source} ({selected_date}).")
                     st.rerun()
                 except Exception as exc:
@@ -5,9 +5,13 @@ import csv
 import json
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +22,9 @@ logger = logging.getLogger(__name__)
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
 
+# Sites run in parallel; each child's output is forwarded as one block.
+_OUTPUT_LOCK = threading.Lock()
+
 
 @dataclass
 class SiteConfig:
@@ -95,6 +102,12 @@ def parse_args() -> argparse.Namespace:
         default=600,
         help="Timeout in seconds per site script.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=len(SITE_CONFIGS),
+        help="Maximum number of site scripts run in parallel (default: one per site).",
+    )
     parser.add_argument(
         "--fail-on-warning",
         action="store_true",
@@ -110,22 +123,82 @@ def normalize_sites(raw_sites: list[str]) -> list[str]:
 def validate_site_csv(csv_path: Path, date_col: str, sep: str = ";") -> tuple[bool, bool, int, int]:
     if not csv_path.exists():
         return False, False, 0, 0
+    if csv_path.suffix == ".parquet":
+        return _validate_site_parquet(csv_path, date_col)
 
     with csv_path.open("r", encoding="utf-8", newline="") as fh:
-        reader = csv.DictReader(fh, delimiter=sep)
-        headers = reader.fieldnames or []
-        if date_col not in headers:
-            total_hotels = sum(1 for _ in reader)
-            return True, False, 0, total_hotels
+        headers = next(csv.reader(fh, delimiter=sep), [])
+    if not headers:
+        return True, False, 0, 0
+    has_date = date_col in headers
+    column = date_col if has_date else headers[0]
 
+    try:
+        scored, total = _count_csv_column(csv_path, column, sep)
+    except (ImportError, KeyError, ValueError):
+        # No pyarrow, or a file it reads differently (ragged rows, a BOM in
+        # the header): count with the csv module.
+        scored, total = _count_csv_column_slow(csv_path, column, sep)
+    return True, has_date, scored if has_date else 0, total
+
+
+def _count_csv_column(csv_path: Path, column: str, sep: str) -> tuple[int, int]:
+    """Return (non-blank cells, rows) for one column, decoding only that column."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pac
+
+    table = pac.read_csv(
+        csv_path,
+        parse_options=pac.ParseOptions(delimiter=sep),
+        convert_options=pac.ConvertOptions(
+            include_columns=[column],
+            column_types={column: pa.string()},
+            strings_can_be_null=False,
+        ),
+    )
+    values = pc.utf8_trim_whitespace(table.column(0))
+    return pc.sum(pc.not_equal(values, "")).as_py() or 0, table.num_rows
+
+
+def _count_csv_column_slow(csv_path: Path, column: str, sep: str) -> tuple[int, int]:
+    with csv_path.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.DictReader(fh, delimiter=sep)
         scored = 0
         total = 0
         for row in reader:
             total += 1
-            value = row.get(date_col)
+            value = row.get(column)
             if value is not None and str(value).strip() != "":
                 scored += 1
-        return True, True, scored, total
+        return scored, total
+
+
+def _validate_site_parquet(path: Path, date_col: str) -> tuple[bool, bool, int, int]:
+    """Parquet variant of validate_site_csv; the date check only reads the schema."""
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    total = parquet_file.metadata.num_rows
+    if date_col not in parquet_file.schema_arrow.names:
+        return True, False, 0, total
+
+    column = parquet_file.read(columns=[date_col]).column(0)
+    return True, True, len(column) - column.null_count, total
+
+
+def _forward_output(out, err) -> None:
+    """Copy spooled child stdout/stderr to ours in large binary writes."""
+    with _OUTPUT_LOCK:
+        for spool, stream in ((out, sys.stdout), (err, sys.stderr)):
+            spool.seek(0)
+            stream.flush()
+            target = getattr(stream, "buffer", None)
+            if target is None:
+                stream.write(spool.read().decode("utf-8", errors="replace"))
+            else:
+                shutil.copyfileobj(spool, target, 1 << 20)
+                target.flush()
 
 
 def run_site(site: str, config: SiteConfig, date_col: str, python_cmd: str, timeout: int) -> SiteResult:
@@ -185,9 +258,17 @@ def run_site(site: str, config: SiteConfig, date_col: str, python_cmd: str, time
     cmd = [python_cmd, str(resolved_script), "--date", date_col]
     logger.info("[run] %s: %s", site, " ".join(cmd))
 
-    try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, check=False)
-    except subprocess.TimeoutExpired:
+    # Spool child output to temp files rather than pipes: nothing is held in
+    # memory or decoded, and partial output survives a timeout.
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        try:
+            proc = subprocess.run(cmd, stdout=out, stderr=err, timeout=timeout, check=False)
+        except subprocess.TimeoutExpired:
+            proc = None
+        finally:
+            _forward_output(out, err)
+
+    if proc is None:
         message = f"Timed out after {timeout}s"
         print(f"::error title={site}::{message}")
         return SiteResult(
@@ -203,11 +284,6 @@ def run_site(site: str, config: SiteConfig, date_col: str, python_cmd: str, time
             total_hotels=0,
         )
 
-    if proc.stdout:
-        print(proc.stdout)
-    if proc.stderr:
-        print(proc.stderr, file=sys.stderr)
-
     if proc.returncode != 0:
         message = f"Script exited with code {proc.returncode}"
         print(f"::error title={site}::{message}")
@@ -278,16 +354,20 @@ def main() -> int:
         logger.error("No valid sites selected.")
         return 1
 
-    results: list[SiteResult] = []
-    for site in selected_sites:
-        result = run_site(
-            site=site,
-            config=SITE_CONFIGS[site],
-            date_col=args.date,
-            python_cmd=args.python,
-            timeout=args.timeout,
-        )
-        results.append(result)
+    # Each task only supervises a subprocess, so threads are enough; map()
+    # keeps the results (and the summary) in the requested site order.
+    workers = max(1, min(args.workers, len(selected_sites)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results: list[SiteResult] = list(executor.map(
+            lambda site: run_site(
+                site=site,
+                config=SITE_CONFIGS[site],
+                date_col=args.date,
+                python_cmd=args.python,
+                timeout=args.timeout,
+            ),
+            selected_sites,
+        ))
 
     failed = [r for r in results if r.status == "failed"]
     warned = [r for r in results if r.warning]
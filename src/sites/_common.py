@@ -0,0 +1,201 @@
+"""
+Helpers shared by the score scrapers in this package.
+
+The scrapers also run as plain scripts (``python src/sites/booking.py``), so
+they put the repository root on ``sys.path`` before importing this module.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from time import sleep
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
+
+
+# ---------------------------- CSV logic ---------------------------- #
+
+def ensure_csv(csv_path: str, sep: str, hotels: list[str]) -> pd.DataFrame:
+    """
+    Load the CSV, or start an empty frame when it does not exist yet (main
+    writes the file once, after scraping). Ensure the index includes all
+    hotels and that an 'Average Score' column exists.
+    """
+    if not os.path.exists(csv_path):
+        logger.info("Creating %s", csv_path)
+        df = pd.DataFrame(index=hotels)
+        df.index.name = "Hotel"
+        df["Average Score"] = pd.NA
+        df.attrs["date_cols"] = []
+        return df
+
+    df = pd.read_csv(csv_path, sep=sep, index_col="Hotel")
+    # Missing hotels are appended as empty rows in one reindex, keeping the
+    # file's row order (a union would sort the index).
+    known = set(df.index)
+    missing = [h for h in hotels if h not in known]
+    if missing:
+        df = df.reindex(df.index.append(pd.Index(missing, name=df.index.name)))
+    if "Average Score" not in df.columns:
+        df["Average Score"] = pd.NA
+    df.attrs["date_cols"] = date_columns(df)
+    return df
+
+
+def date_columns(df: pd.DataFrame) -> list[str]:
+    """Columns that look like YYYY-MM-DD, in file order."""
+    return [c for c in df.columns if isinstance(c, str) and DATE_COL_RE.fullmatch(c)]
+
+
+def update_average(df: pd.DataFrame) -> None:
+    """
+    Recompute 'Average Score' across all columns that look like YYYY-MM-DD.
+    (Non-date columns are ignored.) Uses df.attrs["date_cols"] when
+    ensure_csv/main keep it up to date, instead of re-matching every column.
+    """
+    date_cols = df.attrs.get("date_cols") or date_columns(df)
+    if date_cols:
+        df["Average Score"] = df[date_cols].mean(axis=1, numeric_only=True).round(2)
+
+
+def save_csv(df: pd.DataFrame, csv_path: str, sep: str) -> None:
+    """
+    Write the scores next to the target and swap the file in with
+    os.replace, so a run killed mid-write never leaves a torn CSV behind.
+    """
+    tmp_path = csv_path + ".tmp"
+    try:
+        df.to_csv(tmp_path, sep=sep, index_label="Hotel")
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ------------------------- Request pacing -------------------------- #
+
+def make_session(pool_maxsize: int, max_retries: Retry | None = None) -> requests.Session:
+    """
+    Session with keep-alive pooling sized for the worker threads, so
+    same-host requests reuse TCP/TLS connections. By default urllib3 only
+    retries failed connects and HTTP status retries stay with the caller;
+    pass ``max_retries`` to let urllib3 retry statuses as well.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max(1, pool_maxsize),
+        max_retries=max_retries or Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+
+class HostThrottle:
+    """
+    Space out requests to the same host by a random delay in
+    [min_delay, max_delay], shared across threads. Requests to different
+    hosts do not wait for each other.
+    """
+
+    def __init__(self, min_delay: float, max_delay: float) -> None:
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + random.uniform(self.min_delay, self.max_delay)
+        if slot > now:
+            sleep(slot - now)
+
+
+def body_encoding(resp) -> str:
+    """
+    Charset declared in the Content-Type header, else UTF-8. requests
+    reports ISO-8859-1 for any text/* response without one, which would
+    mangle the UTF-8 pages these sites serve.
+    """
+    if "charset" in str(resp.headers.get("content-type", "")).lower():
+        return resp.encoding or "utf-8"
+    return "utf-8"
+
+
+# ------------------- Conditional requests (ETag) ------------------- #
+# The cache maps url -> {"etag", "last_modified", "score"}: a 304 answer
+# means the page, and so its score, is unchanged since the last run.
+
+def conditional_headers(cached: dict | None, base: dict[str, str] | None = None) -> dict[str, str]:
+    """``base`` headers plus If-None-Match / If-Modified-Since from a cache entry."""
+    headers = dict(base or {})
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def remember_validators(
+    http_cache: dict[str, dict], url: str, resp: requests.Response, score: float | None
+) -> None:
+    """
+    Store the response's ETag / Last-Modified with its score (if it sent any).
+    ``score`` may be filled in later by the caller, once the page is parsed.
+    """
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        http_cache[url] = {"etag": etag, "last_modified": last_modified, "score": score}
+    else:
+        http_cache.pop(url, None)
+
+
+# ------------------------ JSON side caches ------------------------- #
+# Small url/query -> value maps kept next to the CSVs between runs. They are
+# only ever an optimisation: losing one just means a full fetch next time.
+
+def load_json_cache(path: str) -> dict:
+    """Read a JSON cache; a missing or unreadable file means no cache."""
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json_cache(path: str, data: dict) -> None:
+    """Best-effort atomic write of a JSON cache (the CSV stays canonical)."""
+    if not path:
+        return
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write cache %s: %s", path, e)
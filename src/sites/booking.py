@@ -42,6 +42,8 @@ TIPS
 - Verify each Booking URL in a normal browser to ensure it points to the exact
   property page you want.
 - Be polite with delays; small random sleeps help avoid throttling.
+- ETag / Last-Modified values are kept in data/booking_http_cache.json so repeat
+  runs send conditional requests; pass --http-cache "" to always fetch in full.
 """
 
 from __future__ import annotations
@@ -52,13 +54,24 @@ import re
 import json
 import argparse
 import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 
 import yaml
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+if not __package__:
+    # Run as a script (python src/sites/booking.py): make ``src`` importable.
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.sites._common import (
+    DATE_COL_RE, HostThrottle, body_encoding, ensure_csv, make_session, save_csv, update_average,
+    conditional_headers, load_json_cache, remember_validators, save_json_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,10 +82,16 @@ DEFAULT_CSV = "booking_scores.csv"
 DEFAULT_CSV_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),  # .../src/sites
     "..", "..", "data", DEFAULT_CSV)
+DEFAULT_HTTP_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "data", "booking_http_cache.json")
 DEFAULT_SEP = ";"                # you are using semicolon CSV
 DEFAULT_RETRIES = 2
 DEFAULT_MIN_DELAY = 2.5          # seconds between hotel requests (min)
 DEFAULT_MAX_DELAY = 5.0          # seconds between hotel requests (max)
+DEFAULT_WORKERS = 4              # hotels fetched concurrently
+STREAM_CHUNK_SIZE = 16 * 1024    # bytes read at a time while looking for the rating
+MAX_RETRY_AFTER = 60.0           # longest Retry-After (s) honoured before retrying
 
 _CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "hotels.yaml")
 
@@ -95,10 +114,26 @@ UA_HEADERS = {
     "Referer": "https://www.booking.com/",
 }
 
-DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Only the JSON-LD blocks are read, so the rest of the page is never built
+# into a tree.
+JSONLD_ONLY = SoupStrainer("script", type="application/ld+json")
+# <script type="application/ld+json"> bodies, found without building a DOM
+# (script contents are raw text in HTML, so no entity decoding is needed).
+JSONLD_SCRIPT_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(?P<body>.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+# A flat aggregateRating object with a numeric ratingValue: read straight
+# from the script text, without decoding the whole JSON-LD document.
+AGG_RATING_RE = re.compile(
+    r'"aggregateRating"\s*:\s*\{[^{}]*?"ratingValue"\s*:\s*"?(?P<value>\d+(?:[.,]\d+)?)"?\s*[,}]'
+)
 
 
 # -------------------------- Scraper logic -------------------------- #
+
+
 def sanitize_booking_score(score: float | None) -> float | None:
     if score is None:
         return None
@@ -111,77 +146,143 @@ def sanitize_booking_score(score: float | None) -> float | None:
     logger.warning("Booking score out of expected range 0-10: %s. Ignoring value.", value)
     return None
 
-def fetch_booking_rating(url: str, session: requests.Session, retries: int = DEFAULT_RETRIES) -> float | None:
+def fetch_booking_rating(
+    url: str,
+    session: requests.Session,
+    retries: int = DEFAULT_RETRIES,
+    http_cache: dict[str, dict] | None = None,
+) -> float | None:
     """
     Fetch the Booking rating for a single property page.
     Strategy: parse JSON-LD blocks for "aggregateRating"->"ratingValue".
     Returns a float (e.g., 8.7) or None if not found.
+
+    With ``http_cache`` (url -> {"etag", "last_modified", "score"}), the
+    request is made conditional and a 304 reuses the stored score.
     """
+    cached = http_cache.get(url) if http_cache is not None else None
+    headers = conditional_headers(cached, UA_HEADERS)
     for attempt in range(retries + 1):
+        wait_s = None  # set by the except branches when the server asks for a delay
         try:
-            r = session.get(url, headers=UA_HEADERS, timeout=20)
-            r.raise_for_status()
-            soup = BeautifulSoup(r.text, "html.parser")
-
-            for tag in soup.find_all("script", type="application/ld+json"):
-                try:
-                    data = json.loads(tag.string or "")
-                except Exception:
-                    continue
-
-                # JSON-LD could be a dict or a list
-                items = data if isinstance(data, list) else [data]
-                for obj in items:
-                    if not isinstance(obj, dict):
-                        continue
-                    agg = obj.get("aggregateRating")
-                    if isinstance(agg, dict) and "ratingValue" in agg:
-                        val = str(agg.get("ratingValue"))
-                        # Normalize decimal separator & cast
-                        return sanitize_booking_score(float(val.replace(",", ".")))
-
+            r = session.get(url, headers=headers, timeout=20, stream=True)
+            try:
+                if r.status_code == 304 and cached is not None:
+                    logger.info("%s: not modified, reusing %s", url, cached["score"])
+                    return cached["score"]
+                r.raise_for_status()
+                value = _read_rating(r)
+            finally:
+                r.close()
+            if value is not None:
+                score = sanitize_booking_score(value)
+                if http_cache is not None and score is not None:
+                    remember_validators(http_cache, url, r, score)
+                return score
+
+        except requests.HTTPError as e:
+            status = getattr(e.response, "status_code", None)
+            if isinstance(status, int) and 400 <= status < 500 and status != 429:
+                # Not found / forbidden will not change on a retry.
+                logger.warning("%s: HTTP %d, not retrying", url, status)
+                return None
+            logger.warning("%s attempt %d failed: %s", url, attempt + 1, e)
+            wait_s = retry_after_seconds(e.response)
         except Exception as e:
             logger.warning("%s attempt %d failed: %s", url, attempt + 1, e)
 
-        # simple backoff/jitter
-        sleep(random.uniform(2.0, 4.0) * (attempt + 1))
+        if attempt < retries:
+            # Server-requested delay on 429/503, else exponential backoff with jitter
+            if wait_s is None:
+                wait_s = random.uniform(2.0, 4.0) * 2 ** attempt
+            sleep(wait_s)
 
     return None
 
 
-# ---------------------------- CSV logic ---------------------------- #
-
-def ensure_csv(csv_path: str, sep: str, hotels: list[str]) -> pd.DataFrame:
+def _read_rating(resp: requests.Response) -> float | None:
     """
-    Create or load the CSV. Ensure the index includes all hotels and
-    that an 'Average Score' column exists.
+    Stream the page and stop as soon as a JSON-LD block holding
+    aggregateRating has been received; the rest of the page (most of its
+    bytes) is never downloaded. Reads to the end if no such block yields
+    a rating.
     """
-    if not os.path.exists(csv_path):
-        logger.info("Creating %s", csv_path)
-        df = pd.DataFrame(index=hotels)
-        df.index.name = "Hotel"
-        df["Average Score"] = pd.NA
-        df.to_csv(csv_path, sep=sep, index_label="Hotel")
-        return df
-
-    df = pd.read_csv(csv_path, sep=sep, index_col="Hotel")
-    # Make sure all hotels exist as rows
-    for h in hotels:
-        if h not in df.index:
-            df.loc[h] = pd.Series(dtype="float64")
-    if "Average Score" not in df.columns:
-        df["Average Score"] = pd.NA
-    return df
-
-
-def update_average(df: pd.DataFrame) -> None:
+    encoding = body_encoding(resp)
+    buf = bytearray()
+    scan_from = 0
+    for chunk in resp.iter_content(STREAM_CHUNK_SIZE):
+        buf.extend(chunk)
+        pos = buf.find(b'"aggregateRating"', scan_from)
+        if pos < 0:
+            # keep an overlap so a marker split across chunks is still found
+            scan_from = max(0, len(buf) - 32)
+            continue
+        end = buf.find(b"</script", pos)
+        if end < 0:
+            scan_from = pos
+            continue
+        value = _rating_from_html(buf.decode(encoding, errors="replace"))
+        if value is not None:
+            return value
+        scan_from = end
+    return _rating_from_html(buf.decode(encoding, errors="replace"))
+
+
+def _rating_from_html(html: str) -> float | None:
+    """Raw aggregateRating.ratingValue from the page's JSON-LD, or None."""
+    # Plain string scan for the ld+json scripts; BeautifulSoup only
+    # when the markup is too irregular for it to find any.
+    blocks = [m.group("body") for m in JSONLD_SCRIPT_RE.finditer(html)]
+    if not blocks:
+        soup = BeautifulSoup(html, "html.parser", parse_only=JSONLD_ONLY)
+        blocks = [tag.string or "" for tag in soup.find_all("script", type="application/ld+json")]
+
+    for raw in blocks:
+        # Breadcrumb/ItemList blobs can be large; only parse blocks
+        # that can hold the rating.
+        if '"aggregateRating"' not in raw:
+            continue
+        # Fast path for the usual single rating; anything less
+        # regular goes through json.loads below.
+        if raw.count('"aggregateRating"') == 1:
+            m = AGG_RATING_RE.search(raw)
+            if m:
+                return float(m.group("value").replace(",", "."))
+        try:
+            data = json.loads(raw)
+        except Exception:
+            continue
+
+        # JSON-LD could be a dict or a list
+        items = data if isinstance(data, list) else [data]
+        for obj in items:
+            if not isinstance(obj, dict):
+                continue
+            agg = obj.get("aggregateRating")
+            if isinstance(agg, dict) and "ratingValue" in agg:
+                val = str(agg.get("ratingValue"))
+                # Normalize decimal separator & cast
+                return float(val.replace(",", "."))
+    return None
+
+
+def retry_after_seconds(resp: requests.Response | None, cap: float = MAX_RETRY_AFTER) -> float | None:
     """
-    Recompute 'Average Score' across all columns that look like YYYY-MM-DD.
-    (Non-date columns are ignored.)
+    Seconds to wait according to a Retry-After header (delta-seconds or an
+    HTTP date), capped at `cap`, plus up to 1s of jitter. None if absent.
     """
-    date_cols = [c for c in df.columns if isinstance(c, str) and DATE_COL_RE.fullmatch(c)]
-    if date_cols:
-        df["Average Score"] = round(df[date_cols].mean(axis=1, numeric_only=True),2)
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = (when - datetime.now(when.tzinfo)).total_seconds()
+    return min(max(seconds, 0.0), cap) + random.random()
 
 
 # ----------------------------- CLI main ---------------------------- #
@@ -195,6 +296,10 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help=f"HTTP retries per hotel (default: {DEFAULT_RETRIES})")
     p.add_argument("--min-delay", type=float, default=DEFAULT_MIN_DELAY, help=f"Min delay (s) between hotels (default: {DEFAULT_MIN_DELAY})")
     p.add_argument("--max-delay", type=float, default=DEFAULT_MAX_DELAY, help=f"Max delay (s) between hotels (default: {DEFAULT_MAX_DELAY})")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Hotels fetched concurrently (default: {DEFAULT_WORKERS})")
+    p.add_argument("--http-cache", default=DEFAULT_HTTP_CACHE_PATH,
+                   help="ETag/Last-Modified cache for conditional requests; '' disables it "
+                        f"(default: {DEFAULT_HTTP_CACHE_PATH})")
     return p.parse_args()
 
 
@@ -209,33 +314,52 @@ def main():
     hotels = list(URLS.keys())
     df = ensure_csv(args.csv, args.sep, hotels)
 
-    session = requests.Session()
+    session = make_session(args.workers)
+    # Each worker touches only its own URL's entry; saved once at the end.
+    http_cache = load_json_cache(args.http_cache)
     today_col = args.date
-    new_scores: dict[str, float | None] = {}
+    # be polite; same-host requests start [min-delay, max-delay] apart
+    throttle = HostThrottle(args.min_delay, args.max_delay)
 
     logger.info("Writing scores into column: %s", today_col)
 
-    for i, (hotel, url) in enumerate(URLS.items(), start=1):
-        logger.info("%02d/%d → %s", i, len(URLS), hotel)
-        score = fetch_booking_rating(url, session, retries=args.retries)
-        score = sanitize_booking_score(score)
-        new_scores[hotel] = score
+    # Each distinct URL is fetched once, even if several hotels share it.
+    url_hotels: dict[str, list[str]] = {}
+    for hotel, url in URLS.items():
+        url_hotels.setdefault(url, []).append(hotel)
+
+    def fetch_one(item: tuple[int, tuple[str, list[str]]]) -> float | None:
+        i, (url, hotels) = item
+        label = ", ".join(hotels)
+        throttle.wait(url)
+        logger.info("%02d/%d → %s", i, len(url_hotels), label)
+        score = fetch_booking_rating(url, session, retries=args.retries, http_cache=http_cache)
         if score is not None:
-            logger.info("  %s/10", score)
+            logger.info("  %s: %s/10", label, score)
         else:
-            logger.warning("  (no score)")
-
-        # be polite; jitter within [min-delay, max-delay]
-        delay = random.uniform(args.min_delay, args.max_delay)
-        sleep(delay)
-
-    # Write column & update average
-    df[today_col] = pd.Series(new_scores)
+            logger.warning("  %s: (no score)", label)
+        return score
+
+    # Hotels no longer configured get NaN for today, as before.
+    df[today_col] = float("nan")
+
+    # I/O-bound: fetches overlap while the throttle keeps the request rate.
+    # Results are written here, on the main thread, as pool.map yields them.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        scores = pool.map(fetch_one, enumerate(url_hotels.items(), start=1))
+        for hotels, score in zip(url_hotels.values(), scores):
+            for hotel in hotels:
+                df.at[hotel, today_col] = score
+
+    # Update average
+    if today_col not in df.attrs["date_cols"]:
+        df.attrs["date_cols"].append(today_col)
     update_average(df)
 
     # Save
-    df.to_csv(args.csv, sep=args.sep, index_label="Hotel")
+    save_csv(df, args.csv, args.sep)
     logger.info("Saved %s. Added/updated column: %s", args.csv, today_col)
+    save_json_cache(args.http_cache, http_cache)
 
 
 if __name__ == "__main__":
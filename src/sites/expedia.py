@@ -37,11 +37,14 @@ beautifulsoup4
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
 import argparse
-import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from datetime import datetime
 from typing import Dict, Optional
@@ -52,6 +55,14 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+if not __package__:
+    # Run as a script (python src/sites/expedia.py): make ``src`` importable.
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.sites._common import (
+    DATE_COL_RE, HostThrottle, body_encoding, ensure_csv, make_session, save_csv, update_average,
+    conditional_headers, load_json_cache, remember_validators, save_json_cache,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,13 +73,57 @@ DEFAULT_CSV_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),  # .../src/sites
     "..", "..", "data", DEFAULT_CSV
 )
+DEFAULT_HTTP_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "data", "expedia_http_cache.json"
+)
 DEFAULT_SEP = ";"                # semicolon CSV
 DEFAULT_TIMEOUT = 20
 DEFAULT_MIN_DELAY = 2.0
 DEFAULT_MAX_DELAY = 5.0
 DEFAULT_RETRIES = 2
+DEFAULT_WORKERS = 4              # hotels fetched concurrently
+MAX_PAGE_BYTES = 4_000_000       # body bytes read per page (None: no limit)
+STREAM_CHUNK_SIZE = 64 * 1024
 
-DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
+
+# Score extraction patterns, compiled once rather than on every hotel.
+_JSONLD_AGG_RE = re.compile(
+    r'"aggregateRating"\s*:\s*\{(?P<body>[^{}]*?"ratingValue"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?[^{}]*?)\}',
+    re.IGNORECASE | re.DOTALL,
+)
+_JSONLD_BEST_10_RE = re.compile(r'"bestRating"\s*:\s*"?(10|10\.0)"?', re.IGNORECASE)
+_JSONLD_BEST_5_RE = re.compile(r'"bestRating"\s*:\s*"?(5|5\.0)"?', re.IGNORECASE)
+_JSONLD_REVIEW_RE = re.compile(r"review|ratingCount|reviewCount", re.IGNORECASE)
+_JSONLD_CLASS_RE = re.compile(r"star|class|classification", re.IGNORECASE)
+
+# One pass over the page text for all three renderings. The lookahead keeps
+# matches zero-width so "Guest rating 8.6 out of 10" still yields the
+# "out of 10" hit; group order is the precedence (out of 10, /10, guest rating).
+_TEXT_SCORE_RE = re.compile(
+    r"(?=(?P<out_of>\d+(?:\.\d+)?)\s+out of\s+10"
+    r"|(?P<slash>\d+(?:\.\d+)?)/10"
+    r"|guest rating[^0-9]{0,30}(?P<guest>\d+(?:\.\d+)?))",
+    re.IGNORECASE,
+)
+_TEXT_SCORE_GROUPS = ("out_of", "slash", "guest")
+
+_EMBEDDED_SCORE_RES = [
+    re.compile(r'"reviewScore(?:WithDescription)?"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?', re.IGNORECASE),
+    re.compile(r'"overall(?:Guest)?Rating"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?', re.IGNORECASE),
+    re.compile(r'"ratingValue"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?', re.IGNORECASE),
+    re.compile(r'\\"ratingValue\\"\s*:\s*\\"(?P<score>\d+(?:\.\d+)?)\\"', re.IGNORECASE),
+    re.compile(r'\\\\"ratingValue\\\\"\s*:\s*\\\\"(?P<score>\d+(?:\.\d+)?)\\\\"', re.IGNORECASE),
+]
+# Context hints around an embedded match and their rank weights. Each
+# pattern starts with a literal, so a search per hint is cheaper than one
+# alternation that has to be tried at every offset of the window.
+_CTX_HINTS = (
+    (re.compile(r'bestRating"\s*:\s*"?(?:10|10\.0)"?', re.IGNORECASE), 6),
+    (re.compile(r'bestRating"\s*:\s*"?(?:5|5\.0)"?', re.IGNORECASE), -6),
+    (re.compile(r"reviewScore|guestRating|review|out of 10|/10", re.IGNORECASE), 4),
+    (re.compile(r"star|property class|classification|hotel class", re.IGNORECASE), -6),
+)
 
 _CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "hotels.yaml")
 
@@ -140,10 +195,63 @@ def _expedia_url_candidates(url: str) -> list[str]:
                 out.append(no_dialog)
     return out
 
-def fetch_page(url: str, timeout: int, retries: int) -> Optional[str]:
+
+class SessionPool:
+    """
+    One session per User-Agent, each with its own cookie jar, handed out
+    round-robin. A session that got a 403/429 is skipped until it succeeds
+    again (or every session is marked bad, in which case all are used).
+    Each session keeps up to ``pool_maxsize`` connections per host, so size
+    it to the number of worker threads.
+    """
+
+    def __init__(self, user_agents: list[str], pool_maxsize: int = DEFAULT_WORKERS) -> None:
+        self._sessions: list[requests.Session] = []
+        for ua in user_agents:
+            session = make_session(pool_maxsize)
+            session.headers.update({**HEADERS, "User-Agent": ua})
+            self._sessions.append(session)
+        self._bad: set[int] = set()
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def get_session(self) -> requests.Session:
+        with self._lock:
+            usable = [s for s in self._sessions if id(s) not in self._bad] or self._sessions
+            session = usable[self._next % len(usable)]
+            self._next += 1
+            return session
+
+    def mark_bad(self, session: requests.Session) -> None:
+        with self._lock:
+            self._bad.add(id(session))
+
+    def mark_good(self, session: requests.Session) -> None:
+        with self._lock:
+            self._bad.discard(id(session))
+
+
+class PageNotModified(Exception):
+    """The server answered a conditional request with 304 Not Modified."""
+
+
+def fetch_page(
+    url: str,
+    timeout: int,
+    retries: int,
+    max_bytes: int | None = MAX_PAGE_BYTES,
+    http_cache: dict[str, dict] | None = None,
+    session_pool: SessionPool | None = None,
+) -> Optional[str]:
     """
     Fetch the HTML for a given Expedia hotel URL with simple retry logic.
 
+    At most ``max_bytes`` of the body are downloaded (``None`` reads it all).
+    With ``http_cache``, the original URL is requested conditionally: a 304
+    raises PageNotModified, and a fresh page's ETag / Last-Modified are
+    stored under ``url`` with a ``None`` score for the caller to fill in.
+    Pass ``session_pool`` to reuse connections across hotels; without one,
+    a fresh pool is built for this call.
     Returns the response text on success, or None on failure.
     """
     if not url:
@@ -163,29 +271,49 @@ def fetch_page(url: str, timeout: int, retries: int) -> Optional[str]:
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
+    cached = http_cache.get(url) if http_cache is not None else None
+    pool = session_pool or SessionPool(USER_AGENTS)
+
     for candidate_url in candidates:
+        # Validators belong to the original URL, not its fallback variants.
+        headers = conditional_headers(cached) if candidate_url == url else None
         for attempt in range(retries + 1):
+            session = pool.get_session()
             try:
-                request_headers = {
-                    **HEADERS,
-                    "User-Agent": random.choice(USER_AGENTS),
-                }
-                resp = requests.get(
+                resp = session.get(
                     candidate_url,
-                    headers=request_headers,
+                    headers=headers,
                     timeout=timeout,
                     proxies=proxies,
                     allow_redirects=True,
+                    stream=True,
                 )
-                if resp.status_code == 403:
-                    raise requests.HTTPError(f"403 Client Error: Forbidden for url: {candidate_url}")
-                resp.raise_for_status()
-                lowered = resp.text.lower()
+                try:
+                    if resp.status_code == 304 and cached is not None:
+                        pool.mark_good(session)
+                        raise PageNotModified(url)
+                    if resp.status_code in (403, 429):
+                        pool.mark_bad(session)
+                    if resp.status_code == 403:
+                        raise requests.HTTPError(f"403 Client Error: Forbidden for url: {candidate_url}")
+                    resp.raise_for_status()
+                    pool.mark_good(session)
+                    html = _read_body(resp, max_bytes)
+                    if http_cache is not None:
+                        if candidate_url == url:
+                            remember_validators(http_cache, url, resp, None)
+                        else:
+                            http_cache.pop(url, None)
+                finally:
+                    resp.close()
+                lowered = html.lower()
                 if any(marker in lowered for marker in blocked_markers):
                     logger.warning("Possible anti-bot/challenge page for %s", candidate_url)
                 if candidate_url != url:
                     logger.info("Fetched via fallback URL: %s", candidate_url)
-                return resp.text
+                return html
+            except PageNotModified:
+                raise
             except Exception as e:
                 last_exc = e
                 if attempt < retries:
@@ -206,6 +334,24 @@ def fetch_page(url: str, timeout: int, retries: int) -> Optional[str]:
     return None
 
 
+def _read_body(resp: requests.Response, max_bytes: int | None) -> str:
+    """Decode up to ``max_bytes`` of a streamed response body."""
+    chunks: list[bytes] = []
+    size = 0
+    for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        size += len(chunk)
+        if max_bytes is not None and size >= max_bytes:
+            logger.info("Page %s truncated at %d bytes", resp.url, max_bytes)
+            break
+    body = b"".join(chunks)[:max_bytes]
+    # Not resp.text: that runs charset detection over the whole body.
+    try:
+        return body.decode(body_encoding(resp), errors="replace")
+    except LookupError:  # unknown charset label in the header
+        return body.decode("utf-8", errors="replace")
+
+
 def _safe_float(value: str | None) -> Optional[float]:
     if value is None:
         return None
@@ -237,30 +383,18 @@ def _extract_jsonld_score(soup: BeautifulSoup) -> Optional[float]:
 
     for tag in soup.find_all("script", type="application/ld+json"):
         raw = (tag.string or "").strip()
-        if not raw:
+        # Case-insensitive, as _JSONLD_AGG_RE is.
+        if '"aggregaterating"' not in raw.lower():
             continue
-
-        for m in re.finditer(
-            r'"aggregateRating"\s*:\s*\{(?P<body>[^{}]*?"ratingValue"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?[^{}]*?)\}',
-            raw,
-            flags=re.IGNORECASE | re.DOTALL,
-        ):
-            score = _safe_float(m.group("score"))
-            if score is None:
-                continue
-
-            body = m.group("body")
-            rank = 0
-            if re.search(r'"bestRating"\s*:\s*"?(10|10\.0)"?', body, flags=re.IGNORECASE):
-                rank += 6
-            if re.search(r'"bestRating"\s*:\s*"?(5|5\.0)"?', body, flags=re.IGNORECASE):
-                rank -= 6
-            if re.search(r"review|ratingCount|reviewCount", body, flags=re.IGNORECASE):
-                rank += 3
-            if re.search(r"star|class|classification", body, flags=re.IGNORECASE):
-                rank -= 4
-
-            candidates.append((rank, score))
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            # Not valid JSON (truncated, templated, ...): scan the text.
+            candidates.extend(_jsonld_regex_candidates(raw))
+            continue
+        # The walk matches schema.org's exact keys; other spellings
+        # ("AggregateRating", ...) are left to the case-insensitive scan.
+        candidates.extend(_jsonld_candidates(data) or _jsonld_regex_candidates(raw))
 
     if not candidates:
         return None
@@ -269,15 +403,71 @@ def _extract_jsonld_score(soup: BeautifulSoup) -> Optional[float]:
     return candidates[0][1]
 
 
+_LODGING_TYPES = ("hotel", "lodgingbusiness", "resort")
+
+
+def _jsonld_candidates(data) -> list[tuple[int, float]]:
+    """(rank, score) for every aggregateRating in a parsed JSON-LD document."""
+    found: list[tuple[int, float]] = []
+    if isinstance(data, list):
+        for item in data:
+            found.extend(_jsonld_candidates(item))
+        return found
+    if not isinstance(data, dict):
+        return found
+
+    agg = data.get("aggregateRating")
+    if isinstance(agg, dict):
+        score = _safe_float(str(agg.get("ratingValue", "")).replace(",", "."))
+        if score is not None:
+            rank = _jsonld_rank(json.dumps(agg))
+            # The property's own rating beats ratings nested in reviews/offers.
+            node_type = str(data.get("@type", "")).lower()
+            if any(t in node_type for t in _LODGING_TYPES):
+                rank += 2
+            found.append((rank, score))
+    for value in data.values():
+        if isinstance(value, (dict, list)):
+            found.extend(_jsonld_candidates(value))
+    return found
+
+
+def _jsonld_regex_candidates(raw: str) -> list[tuple[int, float]]:
+    """(rank, score) from aggregateRating objects in JSON-LD text that does not parse."""
+    candidates: list[tuple[int, float]] = []
+    for m in _JSONLD_AGG_RE.finditer(raw):
+        score = _safe_float(m.group("score"))
+        if score is not None:
+            candidates.append((_jsonld_rank(m.group("body")), score))
+    return candidates
+
+
+def _jsonld_rank(body: str) -> int:
+    """Rank an aggregateRating object's text: 10-point guest ratings first."""
+    rank = 0
+    if _JSONLD_BEST_10_RE.search(body):
+        rank += 6
+    if _JSONLD_BEST_5_RE.search(body):
+        rank -= 6
+    if _JSONLD_REVIEW_RE.search(body):
+        rank += 3
+    if _JSONLD_CLASS_RE.search(body):
+        rank -= 4
+    return rank
+
+
 def _extract_semantic_div_score(soup: BeautifulSoup) -> Optional[float]:
     """
     Parse score from known Expedia score div classes.
     """
+    # A plain find_all("div") walk is bs4's fastest path here: class_= filters
+    # and soupsieve's select() are both ~15x slower on large pages. Test the
+    # rare class first so most divs are rejected on one membership check.
     for div in soup.find_all("div"):
-        classes = div.get("class", [])
+        classes = div.get("class", ())
         if (
-            "uitk-text" in classes
-            and "uitk-type-900" in classes
+            "uitk-type-900" in classes
+            and "uitk-text" in classes
             and "uitk-text-default-theme" in classes
         ):
             score = _safe_float(div.get_text(strip=True))
@@ -292,18 +482,15 @@ def _extract_textual_score(page_text: str) -> Optional[float]:
     - 8.6 out of 10
     - 8.6/10
     """
-    patterns = [
-        r"(\d+(?:\.\d+)?)\s+out of\s+10",
-        r"(\d+(?:\.\d+)?)/10",
-        r"guest rating[^0-9]{0,30}(\d+(?:\.\d+)?)",
-    ]
-    for pattern in patterns:
-        m = re.search(pattern, page_text, flags=re.IGNORECASE)
-        if not m:
-            continue
-        score = _safe_float(m.group(1))
-        if score is not None:
-            return score
+    first: dict[str, str] = {}
+    for m in _TEXT_SCORE_RE.finditer(page_text):
+        group = m.lastgroup
+        if group == "out_of":
+            return _safe_float(m.group(group))
+        first.setdefault(group, m.group(group))
+    for group in _TEXT_SCORE_GROUPS[1:]:
+        if group in first:
+            return _safe_float(first[group])
     return None
 
 
@@ -311,40 +498,27 @@ def _extract_embedded_json_score(html: str) -> Optional[float]:
     """
     Parse score from embedded JS/JSON when visible text selectors fail.
     """
-    patterns = [
-        r'"reviewScore(?:WithDescription)?"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?',
-        r'"overall(?:Guest)?Rating"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?',
-        r'"ratingValue"\s*:\s*"?(?P<score>\d+(?:\.\d+)?)"?',
-        r'\\"ratingValue\\"\s*:\s*\\"(?P<score>\d+(?:\.\d+)?)\\"',
-        r'\\\\"ratingValue\\\\"\s*:\s*\\\\"(?P<score>\d+(?:\.\d+)?)\\\\"',
-    ]
-
-    candidates = [
-        html,
-        html.replace('\\"', '"'),
-        html.replace("\\\\", "\\"),
-    ]
+    # An unescaped copy is only worth scanning if it differs from the page:
+    # an identical copy yields the same matches again.
+    candidates = [html]
+    if '\\"' in html:
+        candidates.append(html.replace('\\"', '"'))
+    if "\\\\" in html:
+        candidates.append(html.replace("\\\\", "\\"))
     scored_matches: list[tuple[int, float]] = []
     for candidate in candidates:
-        for pattern in patterns:
-            for m in re.finditer(pattern, candidate, flags=re.IGNORECASE):
+        for pattern in _EMBEDDED_SCORE_RES:
+            for m in pattern.finditer(candidate):
                 score = _safe_float(m.group("score"))
                 if score is None:
                     continue
 
+                # Search the window in place instead of slicing a copy of it.
                 start = max(0, m.start() - 180)
-                end = min(len(candidate), m.end() + 180)
-                context = candidate[start:end]
-
-                rank = 0
-                if re.search(r'bestRating"\s*:\s*"?(10|10\.0)"?', context, flags=re.IGNORECASE):
-                    rank += 6
-                if re.search(r'bestRating"\s*:\s*"?(5|5\.0)"?', context, flags=re.IGNORECASE):
-                    rank -= 6
-                if re.search(r"reviewScore|guestRating|review|out of 10|/10", context, flags=re.IGNORECASE):
-                    rank += 4
-                if re.search(r"star|property class|classification|hotel class", context, flags=re.IGNORECASE):
-                    rank -= 6
+                end = m.end() + 180
+                rank = sum(
+                    weight for hint, weight in _CTX_HINTS if hint.search(candidate, start, end)
+                )
 
                 scored_matches.append((rank, score))
 
@@ -359,17 +533,21 @@ def debug_expedia_score_candidates(url: str, timeout: int = DEFAULT_TIMEOUT, ret
     """
     Return candidate extraction results to help diagnose parser misses.
     """
-    html = fetch_page(url, timeout=timeout, retries=retries)
+    # The whole page, so nothing past the usual cap is missed.
+    html = fetch_page(url, timeout=timeout, retries=retries, max_bytes=None)
     if html is None:
         return {"fetch_ok": False, "error": "Could not fetch page"}
 
-    soup = BeautifulSoup(html, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
+    return _score_candidates(html, BeautifulSoup(html, "html.parser"))
+
+
+def _score_candidates(html: str, soup: BeautifulSoup) -> dict:
+    """Run every extractor on an already fetched and parsed page."""
     return {
         "fetch_ok": True,
         "jsonld_score": _extract_jsonld_score(soup),
         "semantic_div_score": _extract_semantic_div_score(soup),
-        "textual_score": _extract_textual_score(page_text),
+        "textual_score": _extract_textual_score(soup.get_text(" ", strip=True)),
         "embedded_json_score": _extract_embedded_json_score(html),
         "contains_8_6": "8.6" in html or "8,6" in html,
     }
@@ -380,18 +558,37 @@ def get_expedia_score(
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = DEFAULT_RETRIES,
     debug: bool = False,
+    http_cache: dict[str, dict] | None = None,
+    session_pool: SessionPool | None = None,
 ) -> Optional[float]:
     """
     Extract Expedia guest rating (0–10) from the <div> containing the score.
     Looks for:
         <div class="uitk-text uitk-type-900 uitk-text-default-theme">8.4</div>
+    With ``http_cache``, an unchanged page (304) reuses the stored score.
     """
-    html = fetch_page(url, timeout=timeout, retries=retries)
+    try:
+        html = fetch_page(url, timeout=timeout, retries=retries, http_cache=http_cache, session_pool=session_pool)
+    except PageNotModified:
+        score = http_cache[url]["score"]
+        logger.info("%s: not modified, reusing %s", url, score)
+        return score
     if html is None:
         return None
 
+    score = _score_from_html(html, debug=debug)
+    if http_cache is not None and url in http_cache:
+        # fetch_page stored this page's validators; keep them only with a score.
+        if score is None:
+            del http_cache[url]
+        else:
+            http_cache[url]["score"] = score
+    return score
+
+
+def _score_from_html(html: str, debug: bool = False) -> Optional[float]:
+    """Validated Expedia score from a fetched page, or None."""
     soup = BeautifulSoup(html, "html.parser")
-    page_text = soup.get_text(" ", strip=True)
 
     # 1) Prefer JSON-LD when present
     score = _extract_jsonld_score(soup)
@@ -409,8 +606,9 @@ def get_expedia_score(
     if score is not None:
         return validate_expedia_score(score)
 
-    # 4) Textual fallback from page text
-    score = _extract_textual_score(page_text)
+    # 4) Textual fallback from page text (only joined when the cheaper
+    #    structured lookups above found nothing)
+    score = _extract_textual_score(soup.get_text(" ", strip=True))
     if score is not None:
         return validate_expedia_score(score)
 
@@ -420,7 +618,8 @@ def get_expedia_score(
         return validate_expedia_score(score)
 
     if debug:
-        details = debug_expedia_score_candidates(url, timeout=timeout, retries=retries)
+        # Reuse this page rather than fetching it again for the diagnostics.
+        details = _score_candidates(html, soup)
         logger.debug("Extraction candidates: %s", details)
     else:
         logger.warning("No Expedia score pattern matched for this page.")
@@ -428,44 +627,6 @@ def get_expedia_score(
     return None
 
 
-# ---------------------------- CSV logic ---------------------------- #
-
-def ensure_csv(csv_path: str, sep: str, hotels: list[str]) -> pd.DataFrame:
-    """
-    Create or load the CSV. Ensure the index includes all hotels and
-    that an 'Average Score' column exists.
-    """
-    if not os.path.exists(csv_path):
-        logger.info("Creating %s", csv_path)
-        df = pd.DataFrame(index=hotels)
-        df.index.name = "Hotel"
-        df["Average Score"] = pd.NA
-        df.to_csv(csv_path, sep=sep, index_label="Hotel")
-        return df
-
-    df = pd.read_csv(csv_path, sep=sep, index_col="Hotel")
-
-    # Ensure all hotels are present
-    for h in hotels:
-        if h not in df.index:
-            df.loc[h] = pd.Series(dtype="float64")
-
-    if "Average Score" not in df.columns:
-        df["Average Score"] = pd.NA
-
-    return df
-
-
-def update_average(df: pd.DataFrame) -> None:
-    """
-    Recompute 'Average Score' across all columns that look like YYYY-MM-DD.
-    (Non-date columns are ignored.)
-    """
-    date_cols = [c for c in df.columns if isinstance(c, str) and DATE_COL_RE.fullmatch(c)]
-    if date_cols:
-        df["Average Score"] = df[date_cols].mean(axis=1, numeric_only=True).round(2)
-
-
 # ----------------------------- CLI main ---------------------------- #
 
 def parse_args() -> argparse.Namespace:
@@ -511,11 +672,22 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_RETRIES,
         help=f"Retries per hotel (default: {DEFAULT_RETRIES})",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Hotels fetched concurrently (default: {DEFAULT_WORKERS})",
+    )
     p.add_argument(
         "--debug",
         action="store_true",
         help="Enable DEBUG-level logging for parser candidate details.",
     )
+    p.add_argument(
+        "--http-cache",
+        default=DEFAULT_HTTP_CACHE_PATH,
+        help=f"ETag/Last-Modified cache for conditional requests; '' disables it (default: {DEFAULT_HTTP_CACHE_PATH})",
+    )
     return p.parse_args()
 
 
@@ -534,36 +706,61 @@ def main():
     df = ensure_csv(args.csv, args.sep, hotels)
 
     today_col = args.date
-    new_scores: dict[str, Optional[float]] = {}
+    # Same-host requests start [min-delay, max-delay] apart.
+    throttle = HostThrottle(args.min_delay, args.max_delay)
+    # Shared by all worker threads, one pooled connection per worker.
+    session_pool = SessionPool(USER_AGENTS, args.workers)
+    # Each worker touches only its own URL's entry; saved once at the end.
+    http_cache = load_json_cache(args.http_cache)
 
     logger.info("Writing Expedia scores into column: %s", today_col)
 
-    for i, (hotel, url) in enumerate(EXPEDIA_URLS.items(), start=1):
-        logger.info("%02d/%d → %s", i, len(EXPEDIA_URLS), hotel)
+    # Each distinct URL is fetched once, even if several hotels share it.
+    url_hotels: dict[str, list[str]] = {}
+    for hotel, url in EXPEDIA_URLS.items():
+        url_hotels.setdefault(url, []).append(hotel)
+
+    def fetch_one(item: tuple[int, tuple[str, list[str]]]) -> Optional[float]:
+        i, (url, hotels) = item
+        label = ", ".join(hotels)
+        throttle.wait(url)
+        logger.info("%02d/%d → %s", i, len(url_hotels), label)
         score = get_expedia_score(
             url,
             timeout=args.timeout,
             retries=args.retries,
             debug=args.debug,
+            http_cache=http_cache,
+            session_pool=session_pool,
         )
         score = validate_expedia_score(score)
-        new_scores[hotel] = score
 
         if score is not None:
-            logger.info("  %s/10", score)
+            logger.info("  %s: %s/10", label, score)
         else:
-            logger.warning("  (no score)")
-
-        delay = random.uniform(args.min_delay, args.max_delay)
-        sleep(delay)
-
-    # Write column & update average
-    df[today_col] = pd.Series(new_scores)
+            logger.warning("  %s: (no score)", label)
+        return score
+
+    # Hotels no longer configured get NaN for today, as before.
+    df[today_col] = float("nan")
+
+    # I/O-bound: fetches overlap while the throttle keeps the request rate.
+    # Results are written here, on the main thread, as pool.map yields them.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        scores = pool.map(fetch_one, enumerate(url_hotels.items(), start=1))
+        for hotels, score in zip(url_hotels.values(), scores):
+            for hotel in hotels:
+                df.at[hotel, today_col] = score
+
+    # Update average
+    if today_col not in df.attrs["date_cols"]:
+        df.attrs["date_cols"].append(today_col)
     update_average(df)
 
     # Save
-    df.to_csv(args.csv, sep=args.sep, index_label="Hotel")
+    save_csv(df, args.csv, args.sep)
     logger.info("Saved %s. Added/updated column: %s", args.csv, today_col)
+    save_json_cache(args.http_cache, http_cache)
 
 
 if __name__ == "__main__":
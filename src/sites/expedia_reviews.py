@@ -94,43 +94,60 @@ def _hotel_url_to_base_url(hotel_url: str) -> str:
 
 # ---------------------- Playwright fetch ---------------------- #
 
+# Static assets are not needed to read the reviews dialog.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+
 async def _async_fetch_reviews_page(url: str, timeout: int = 30000) -> str | None:
     """Async version of fetch_reviews_page for use inside event loops (e.g. Jupyter)."""
     base_url = _hotel_url_to_base_url(url)
     candidates = _expedia_url_candidates(base_url)
 
-    for candidate_url in candidates:
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=random.choice(USER_AGENTS),
-                    locale="en-US",
-                )
-                page = await context.new_page()
-                try:
-                    await page.goto(candidate_url, timeout=timeout, wait_until="networkidle")
-
-                    reviews_btn = page.locator('[data-stid="reviews-link"]')
-                    if await reviews_btn.count() == 0:
-                        logger.warning("No reviews button found on %s", candidate_url)
-                        continue
+    async def block_assets(route):
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
-                    await reviews_btn.click()
-                    await page.wait_for_selector(
-                        '[data-stid="product-reviews-list-item"]',
-                        timeout=15000,
+    try:
+        async with async_playwright() as p:
+            # One browser for all URL variants; each attempt gets a fresh context.
+            browser = await p.chromium.launch(headless=True)
+            try:
+                for candidate_url in candidates:
+                    context = await browser.new_context(
+                        user_agent=random.choice(USER_AGENTS),
+                        locale="en-US",
                     )
-
-                    html = await page.content()
-                    if candidate_url != base_url:
-                        logger.info("Fetched via fallback URL: %s", candidate_url)
-                    return html
-                finally:
-                    await browser.close()
-        except Exception as e:
-            logger.warning("Playwright fetch failed for %s: %s", candidate_url, e)
-            continue
+                    try:
+                        await context.route("**/*", block_assets)
+                        page = await context.new_page()
+                        await page.goto(candidate_url, timeout=timeout, wait_until="networkidle")
+
+                        reviews_btn = page.locator('[data-stid="reviews-link"]')
+                        if await reviews_btn.count() == 0:
+                            logger.warning("No reviews button found on %s", candidate_url)
+                            continue
+
+                        await reviews_btn.click()
+                        await page.wait_for_selector(
+                            '[data-stid="product-reviews-list-item"]',
+                            timeout=15000,
+                        )
+
+                        html = await page.content()
+                        if candidate_url != base_url:
+                            logger.info("Fetched via fallback URL: %s", candidate_url)
+                        return html
+                    except Exception as e:
+                        logger.warning("Playwright fetch failed for %s: %s", candidate_url, e)
+                        continue
+                    finally:
+                        await context.close()
+            finally:
+                await browser.close()
+    except Exception as e:
+        logger.warning("Playwright browser launch failed: %s", e)
 
     logger.error("Failed to fetch reviews on all Expedia URL variants")
     return None
@@ -141,39 +158,52 @@ def _sync_fetch_reviews_page(url: str, timeout: int = 30000) -> str | None:
     base_url = _hotel_url_to_base_url(url)
     candidates = _expedia_url_candidates(base_url)
 
-    for candidate_url in candidates:
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent=random.choice(USER_AGENTS),
-                    locale="en-US",
-                )
-                page = context.new_page()
-                try:
-                    page.goto(candidate_url, timeout=timeout, wait_until="networkidle")
-
-                    reviews_btn = page.locator('[data-stid="reviews-link"]')
-                    if reviews_btn.count() == 0:
-                        logger.warning("No reviews button found on %s", candidate_url)
-                        continue
-
-                    reviews_btn.click()
+    def block_assets(route):
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
 
-                    page.wait_for_selector(
-                        '[data-stid="product-reviews-list-item"]',
-                        timeout=15000,
+    try:
+        with sync_playwright() as p:
+            # One browser for all URL variants; each attempt gets a fresh context.
+            browser = p.chromium.launch(headless=True)
+            try:
+                for candidate_url in candidates:
+                    context = browser.new_context(
+                        user_agent=random.choice(USER_AGENTS),
+                        locale="en-US",
                     )
-
-                    html = page.content()
-                    if candidate_url != base_url:
-                        logger.info("Fetched via fallback URL: %s", candidate_url)
-                    return html
-                finally:
-                    browser.close()
-        except Exception as e:
-            logger.warning("Playwright fetch failed for %s: %s", candidate_url, e)
-            continue
+                    try:
+                        context.route("**/*", block_assets)
+                        page = context.new_page()
+                        page.goto(candidate_url, timeout=timeout, wait_until="networkidle")
+
+                        reviews_btn = page.locator('[data-stid="reviews-link"]')
+                        if reviews_btn.count() == 0:
+                            logger.warning("No reviews button found on %s", candidate_url)
+                            continue
+
+                        reviews_btn.click()
+
+                        page.wait_for_selector(
+                            '[data-stid="product-reviews-list-item"]',
+                            timeout=15000,
+                        )
+
+                        html = page.content()
+                        if candidate_url != base_url:
+                            logger.info("Fetched via fallback URL: %s", candidate_url)
+                        return html
+                    except Exception as e:
+                        logger.warning("Playwright fetch failed for %s: %s", candidate_url, e)
+                        continue
+                    finally:
+                        context.close()
+            finally:
+                browser.close()
+    except Exception as e:
+        logger.warning("Playwright browser launch failed: %s", e)
 
     logger.error("Failed to fetch reviews on all Expedia URL variants")
     return None
@@ -203,12 +233,25 @@ def fetch_reviews_page(url: str, timeout: int = 30000) -> str | None:
 
 # ---------------------- HTML scraping ---------------------- #
 
+# Compiled once: the parsers below run for every review on every page.
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DAY_RE = re.compile(r"(\d{1,2})")
+_YEAR_RE = re.compile(r"(\d{4})")
+_H3_RATING_RE = re.compile(r"(\d+(?:\.\d+)?)/10")
+_H3_TITLE_RE = re.compile(r"\d+(?:\.\d+)?/10\s+(.*)")
+_TRAVEL_DATE_RE = re.compile(
+    r"\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\w*\s+\d{4}",
+    re.I,
+)
+
+
 def _parse_rating(text: str) -> float | None:
     """Extract a numeric rating from text like '8.6' or '9,0'."""
     if not text:
         return None
     cleaned = text.strip().replace(",", ".")
-    m = re.search(r"(\d+(?:\.\d+)?)", cleaned)
+    m = _NUMBER_RE.search(cleaned)
     if m:
         try:
             score = float(m.group(1))
@@ -232,7 +275,7 @@ def _parse_date(text: str) -> str:
     text = text.strip()
 
     # ISO format
-    if re.match(r"\d{4}-\d{2}-\d{2}", text):
+    if _ISO_DATE_RE.match(text):
         return text[:10]
 
     # "Mar 12, 2025" or "March 12, 2025"
@@ -244,8 +287,8 @@ def _parse_date(text: str) -> str:
     lower = text.lower()
     for month_key, month_num in en_months.items():
         if month_key in lower:
-            day_m = re.search(r"(\d{1,2})", text)
-            year_m = re.search(r"(\d{4})", text)
+            day_m = _DAY_RE.search(text)
+            year_m = _YEAR_RE.search(text)
             if year_m:
                 day = day_m.group(1).zfill(2) if day_m else "01"
                 return f"{year_m.group(1)}-{month_num}-{day}"
@@ -307,7 +350,7 @@ def _parse_expedia_review_item(item: Tag) -> dict:
     h3 = item.find("h3")
     if h3:
         h3_text = h3.get_text(strip=True)
-        m = re.match(r"(\d+(?:\.\d+)?)/10", h3_text)
+        m = _H3_RATING_RE.match(h3_text)
         if m:
             rating = _parse_rating(m.group(1))
 
@@ -320,13 +363,9 @@ def _parse_expedia_review_item(item: Tag) -> dict:
     # Date and travel type from uitk-type-300 divs
     travel_date = ""
     type_300_divs = item.find_all("div", class_="uitk-type-300")
-    date_pattern = re.compile(
-        r"\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\w*\s+\d{4}",
-        re.I,
-    )
     for div in type_300_divs:
         text = div.get_text(strip=True)
-        if date_pattern.search(text):
+        if _TRAVEL_DATE_RE.search(text):
             travel_date = _parse_date(text)
             break
 
@@ -345,7 +384,7 @@ def _parse_expedia_review_item(item: Tag) -> dict:
     title = ""
     if h3:
         h3_text = h3.get_text(strip=True)
-        m = re.match(r"\d+(?:\.\d+)?/10\s+(.*)", h3_text)
+        m = _H3_TITLE_RE.match(h3_text)
         if m:
             title = m.group(1).strip()
 
@@ -41,9 +41,10 @@ from __future__ import annotations
 
 import logging
 import os
-import re
+import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict
 
@@ -51,6 +52,13 @@ import yaml
 import pandas as pd
 import requests
 
+if not __package__:
+    # Run as a script (python src/sites/google.py): make ``src`` importable.
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.sites._common import (
+    DATE_COL_RE, ensure_csv, make_session, save_csv, update_average, load_json_cache, save_json_cache,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,10 +69,16 @@ DEFAULT_CSV_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),  # .../src/sites
     "..", "..", "data", DEFAULT_CSV
 )
+DEFAULT_PLACE_IDS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "data", "google_place_ids.json"
+)
 DEFAULT_SEP = ";"                # semicolon CSV
 DEFAULT_TIMEOUT = 15
+DEFAULT_WORKERS = 4              # Places queries in flight at once
 
 PLACES_SEARCH_TEXT_URL = "https://places.googleapis.com/v1/places:searchText"
+PLACE_DETAILS_URL = "https://places.googleapis.com/v1/places/{place_id}"
 
 _CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "hotels.yaml")
 
@@ -76,8 +90,6 @@ def _load_hotel_queries() -> Dict[str, str]:
 # Map of hotel display name -> text query for Places search
 HOTEL_QUERIES: Dict[str, str] = _load_hotel_queries()
 
-DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
-
 
 # -------------------------- API logic ------------------------------ #
 
@@ -93,15 +105,33 @@ def sanitize_google_score(score: float | None) -> float | None:
     logger.warning("Google score out of expected range 0-5: %s. Ignoring value.", value)
     return None
 
-def get_google_rating(query: str, api_key: str, timeout: int = DEFAULT_TIMEOUT) -> float | None:
+
+def get_google_rating(
+    query: str,
+    api_key: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
+) -> float | None:
     """
     Call Google Places Text Search for the given query and return the rating (0–5).
+    Pass ``session`` (see make_session) to reuse connections across hotels.
 
     Returns
     -------
     float or None
         Rating if found, else None.
     """
+    place = search_place(query, api_key, timeout=timeout, session=session)
+    return _place_rating(place)
+
+
+def search_place(
+    query: str,
+    api_key: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
+) -> dict | None:
+    """First Places Text Search result for ``query`` (id, name, rating), or None."""
     if not query:
         return None
 
@@ -116,7 +146,7 @@ def get_google_rating(query: str, api_key: str, timeout: int = DEFAULT_TIMEOUT)
         "textQuery": query
     }
 
-    resp = requests.post(
+    resp = (session or requests).post(
         PLACES_SEARCH_TEXT_URL,
         headers=headers,
         data=json.dumps(payload),
@@ -128,8 +158,35 @@ def get_google_rating(query: str, api_key: str, timeout: int = DEFAULT_TIMEOUT)
     places = data.get("places", [])
     if not places:
         return None
+    return places[0]
+
+
+def get_place_rating(
+    place_id: str,
+    api_key: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
+) -> float | None:
+    """
+    Rating (0–5) of a known place via Place Details: a GET for two fields
+    instead of a text search.
+    """
+    headers = {
+        "X-Goog-Api-Key": api_key,
+        "X-Goog-FieldMask": "rating,userRatingCount",
+    }
+    resp = (session or requests).get(
+        PLACE_DETAILS_URL.format(place_id=place_id),
+        headers=headers,
+        timeout=timeout,
+    )
+    resp.raise_for_status()
+    return _place_rating(resp.json())
 
-    place = places[0]
+
+def _place_rating(place: dict | None) -> float | None:
+    if not place:
+        return None
     rating = place.get("rating")
     if rating is None:
         return None
@@ -140,44 +197,6 @@ def get_google_rating(query: str, api_key: str, timeout: int = DEFAULT_TIMEOUT)
         return None
 
 
-# ---------------------------- CSV logic ---------------------------- #
-
-def ensure_csv(csv_path: str, sep: str, hotels: list[str]) -> pd.DataFrame:
-    """
-    Create or load the CSV. Ensure the index includes all hotels and
-    that an 'Average Score' column exists.
-    """
-    if not os.path.exists(csv_path):
-        logger.info("Creating %s", csv_path)
-        df = pd.DataFrame(index=hotels)
-        df.index.name = "Hotel"
-        df["Average Score"] = pd.NA
-        df.to_csv(csv_path, sep=sep, index_label="Hotel")
-        return df
-
-    df = pd.read_csv(csv_path, sep=sep, index_col="Hotel")
-
-    # Ensure all hotels are present
-    for h in hotels:
-        if h not in df.index:
-            df.loc[h] = pd.Series(dtype="float64")
-
-    if "Average Score" not in df.columns:
-        df["Average Score"] = pd.NA
-
-    return df
-
-
-def update_average(df: pd.DataFrame) -> None:
-    """
-    Recompute 'Average Score' across all columns that look like YYYY-MM-DD.
-    (Non-date columns are ignored.)
-    """
-    date_cols = [c for c in df.columns if isinstance(c, str) and DATE_COL_RE.fullmatch(c)]
-    if date_cols:
-        df["Average Score"] = df[date_cols].mean(axis=1, numeric_only=True).round(2)
-
-
 # ----------------------------- CLI main ---------------------------- #
 
 def parse_args() -> argparse.Namespace:
@@ -205,6 +224,17 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT,
         help=f"HTTP timeout per hotel (default: {DEFAULT_TIMEOUT})",
     )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Places queries run concurrently (default: {DEFAULT_WORKERS})",
+    )
+    p.add_argument(
+        "--place-ids",
+        default=DEFAULT_PLACE_IDS_PATH,
+        help=f"Cache of resolved query -> place id; '' disables it (default: {DEFAULT_PLACE_IDS_PATH})",
+    )
     return p.parse_args()
 
 
@@ -227,33 +257,63 @@ def main():
     df = ensure_csv(args.csv, args.sep, hotels)
 
     today_col = args.date
-    new_scores: dict[str, float | None] = {}
+    session = make_session(args.workers)
+    # Keyed by query, so editing a hotel's google_query resolves it again.
+    # Each worker touches only its own query's entry; saved once at the end.
+    place_ids = load_json_cache(args.place_ids)
 
     logger.info("Writing Google ratings into column: %s", today_col)
 
-    for i, (hotel, query) in enumerate(HOTEL_QUERIES.items(), start=1):
+    def rate(hotel: str, query: str) -> float | None:
+        place_id = place_ids.get(query)
+        if place_id:
+            try:
+                return get_place_rating(place_id, api_key=api_key, timeout=args.timeout, session=session)
+            except requests.HTTPError as e:
+                status = getattr(e.response, "status_code", None)
+                if status not in (400, 404):
+                    raise
+                # Stale or invalid id: search again below.
+                logger.warning("  %s: place %s not found (HTTP %s), searching again", hotel, place_id, status)
+                place_ids.pop(query, None)
+        place = search_place(query, api_key=api_key, timeout=args.timeout, session=session)
+        if place and place.get("id"):
+            place_ids[query] = place["id"]
+        return _place_rating(place)
+
+    def fetch_one(item: tuple[int, tuple[str, str]]) -> float | None:
+        i, (hotel, query) = item
         logger.info("%02d/%d → %s", i, len(HOTEL_QUERIES), hotel)
         try:
-            score = get_google_rating(query, api_key=api_key, timeout=args.timeout)
+            score = rate(hotel, query)
         except Exception as e:
-            logger.error("  %s", e)
+            logger.error("  %s: %s", hotel, e)
             score = None
 
         score = sanitize_google_score(score)
-        new_scores[hotel] = score
 
         if score is not None:
-            logger.info("  %s/5", score)
+            logger.info("  %s: %s/5", hotel, score)
         else:
-            logger.warning("  (no score)")
+            logger.warning("  %s: (no score)", hotel)
+        return score
+
+    # The Places API is rate-limited per key, not per connection, so the
+    # queries simply overlap; results keep the configured hotel order.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        scores = pool.map(fetch_one, enumerate(HOTEL_QUERIES.items(), start=1))
+        new_scores: dict[str, float | None] = dict(zip(HOTEL_QUERIES, scores))
 
     # Write column & update average
     df[today_col] = pd.Series(new_scores)
+    if today_col not in df.attrs["date_cols"]:
+        df.attrs["date_cols"].append(today_col)
     update_average(df)
 
     # Save
-    df.to_csv(args.csv, sep=args.sep, index_label="Hotel")
+    save_csv(df, args.csv, args.sep)
     logger.info("Saved %s. Added/updated column: %s", args.csv, today_col)
+    save_json_cache(args.place_ids, place_ids)
 
 
 if __name__ == "__main__":
@@ -31,7 +31,6 @@ REQUIREMENTS
 ------------
 pandas
 requests
-beautifulsoup4
 PyYAML
 """
 
@@ -41,14 +40,22 @@ import logging
 import os
 import re
 import argparse
-import random
-from time import sleep
+import html as html_lib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import yaml
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+
+if not __package__:
+    # Run as a script (python src/sites/holidaycheck.py): make ``src`` importable.
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.sites._common import (
+    DATE_COL_RE, HostThrottle, ensure_csv, make_session, save_csv, update_average,
+    conditional_headers, load_json_cache, remember_validators, save_json_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,10 +66,14 @@ DEFAULT_CSV = "holidaycheck_scores.csv"
 DEFAULT_CSV_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),  # .../src/sites
     "..", "..", "data", DEFAULT_CSV)
+DEFAULT_HTTP_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "data", "holidaycheck_http_cache.json")
 DEFAULT_SEP = ";"                # you are using semicolon CSV
 DEFAULT_TIMEOUT = 15
 DEFAULT_MIN_DELAY = 2.5          # seconds between hotel requests (min)
 DEFAULT_MAX_DELAY = 5.0          # seconds between hotel requests (max)
+DEFAULT_WORKERS = 4              # hotels fetched concurrently
 UA_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -82,7 +93,26 @@ def _load_urls() -> dict[str, str]:
 # Map of hotel display name -> HolidayCheck URL
 URLS = _load_urls()
 
-DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
+
+# Compiled once: get_holidaycheck_score runs them for every hotel page.
+_JSONLD_AGG_RE = re.compile(
+    r'"aggregateRating"\s*:\s*\{[^{}]*?"ratingValue"\s*:\s*"?(?P<score>\d+(?:[.,]\d+)?)"?'
+    r'(?:[^{}]*?"bestRating"\s*:\s*"?(?P<best>\d+(?:[.,]\d+)?)"?)?[^{}]*?\}',
+    re.IGNORECASE | re.DOTALL,
+)
+_TEXT_SCORE_RE = re.compile(r"(\d+[.,]\d)\s*/\s*6")  # e.g. "4,5 / 6"
+# <script type="application/ld+json"> bodies, found without building a DOM
+# (script contents are raw text in HTML, so no entity decoding is needed).
+_JSONLD_SCRIPT_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(?P<body>.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+# Markup that is not visible text: scripts, styles, comments and tags.
+_NON_TEXT_RE = re.compile(
+    r"<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->|<[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
 # -------------------------- Scraper logic -------------------------- #
 
 def _normalize_to_six_scale(score: float, best_rating: float | None) -> float:
@@ -109,9 +139,17 @@ def sanitize_holidaycheck_score(score: float | None) -> float | None:
     return min(6.0, value)
 
 
-def get_holidaycheck_score(url: str, timeout: int = 15) -> float | None:
+def get_holidaycheck_score(
+    url: str,
+    timeout: int = 15,
+    session: requests.Session | None = None,
+    http_cache: dict[str, dict] | None = None,
+) -> float | None:
     """
     Fetch overall HolidayCheck score (0–6 scale) from a hotel page.
+    Pass ``session`` (see make_session) to reuse connections across hotels.
+    With ``http_cache`` (url -> {"etag", "last_modified", "score"}), the
+    request is made conditional and a 304 reuses the stored score.
 
     Returns
     -------
@@ -121,21 +159,27 @@ def get_holidaycheck_score(url: str, timeout: int = 15) -> float | None:
     if not url:
         return None
 
-    resp = requests.get(url, headers=UA_HEADERS, timeout=timeout)
+    cached = http_cache.get(url) if http_cache is not None else None
+    headers = conditional_headers(cached, UA_HEADERS)
+    resp = (session or requests).get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and cached is not None:
+        logger.info("%s: not modified, reusing %s", url, cached["score"])
+        return cached["score"]
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    score = _score_from_html(resp.text)
+    if http_cache is not None and score is not None:
+        remember_validators(http_cache, url, resp, score)
+    return score
 
+
+def _score_from_html(html: str) -> float | None:
+    """HolidayCheck score (0–6) from the page's JSON-LD or text, or None."""
     # 1) Preferred: JSON-LD aggregate rating.
-    for tag in soup.find_all("script", type="application/ld+json"):
-        raw = (tag.string or "").strip()
+    for block in _JSONLD_SCRIPT_RE.finditer(html):
+        raw = block.group("body").strip()
         if not raw:
             continue
-        m = re.search(
-            r'"aggregateRating"\s*:\s*\{[^{}]*?"ratingValue"\s*:\s*"?(?P<score>\d+(?:[.,]\d+)?)"?'
-            r'(?:[^{}]*?"bestRating"\s*:\s*"?(?P<best>\d+(?:[.,]\d+)?)"?)?[^{}]*?\}',
-            raw,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
+        m = _JSONLD_AGG_RE.search(raw)
         if not m:
             continue
         try:
@@ -152,9 +196,7 @@ def get_holidaycheck_score(url: str, timeout: int = 15) -> float | None:
             pass
 
     # 2) Fallback: text pattern like "4,5 / 6"
-    text = soup.get_text(" ", strip=True)
-
-    m = re.search(r"(\d+[.,]\d)\s*/\s*6", text)
+    m = _TEXT_SCORE_RE.search(_visible_text(html))
     if not m:
         return None
 
@@ -165,39 +207,13 @@ def get_holidaycheck_score(url: str, timeout: int = 15) -> float | None:
         return None
 
 
-# ---------------------------- CSV logic ---------------------------- #
-
-def ensure_csv(csv_path: str, sep: str, hotels: list[str]) -> pd.DataFrame:
-    """
-    Create or load the CSV. Ensure the index includes all hotels and
-    that an 'Average Score' column exists.
+def _visible_text(html: str) -> str:
     """
-    if not os.path.exists(csv_path):
-        logger.info("Creating %s", csv_path)
-        df = pd.DataFrame(index=hotels)
-        df.index.name = "Hotel"
-        df["Average Score"] = pd.NA
-        df.to_csv(csv_path, sep=sep, index_label="Hotel")
-        return df
-
-    df = pd.read_csv(csv_path, sep=sep, index_col="Hotel")
-    # Make sure all hotels exist as rows
-    for h in hotels:
-        if h not in df.index:
-            df.loc[h] = pd.Series(dtype="float64")
-    if "Average Score" not in df.columns:
-        df["Average Score"] = pd.NA
-    return df
-
-
-def update_average(df: pd.DataFrame) -> None:
+    Page text without building a DOM: markup becomes spaces (as with
+    get_text(" ")) and entities are decoded, so numbers in URLs, attributes
+    and scripts do not match the text pattern.
     """
-    Recompute 'Average Score' across all columns that look like YYYY-MM-DD.
-    (Non-date columns are ignored.)
-    """
-    date_cols = [c for c in df.columns if isinstance(c, str) and DATE_COL_RE.fullmatch(c)]
-    if date_cols:
-        df["Average Score"] = round(df[date_cols].mean(axis=1, numeric_only=True),2)
+    return html_lib.unescape(_NON_TEXT_RE.sub(" ", html))
 
 
 # ----------------------------- CLI main ---------------------------- #
@@ -211,6 +227,10 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help=f"HTTP timeout per hotel (default: {DEFAULT_TIMEOUT})")
     p.add_argument("--min-delay", type=float, default=2.0, help=f"Min delay (s) between hotels (default: 2.0)")
     p.add_argument("--max-delay", type=float, default=5.0, help=f"Max delay (s) between hotels (default: 5.0)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Hotels fetched concurrently (default: {DEFAULT_WORKERS})")
+    p.add_argument("--http-cache", default=DEFAULT_HTTP_CACHE_PATH,
+                   help="ETag/Last-Modified cache for conditional requests; '' disables it "
+                        f"(default: {DEFAULT_HTTP_CACHE_PATH})")
     return p.parse_args()
 
 
@@ -226,35 +246,45 @@ def main():
     df = ensure_csv(args.csv, args.sep, hotels)
 
     today_col = args.date
-    new_scores: dict[str, float | None] = {}
+    # be polite; same-host requests start [min-delay, max-delay] apart
+    throttle = HostThrottle(args.min_delay, args.max_delay)
+    session = make_session(args.workers)
+    # Each worker touches only its own URL's entry; saved once at the end.
+    http_cache = load_json_cache(args.http_cache)
 
     logger.info("Writing scores into column: %s", today_col)
 
-    for i, (hotel, url) in enumerate(URLS.items(), start=1):
+    def fetch_one(item: tuple[int, tuple[str, str]]) -> float | None:
+        i, (hotel, url) = item
+        throttle.wait(url)
         logger.info("%02d/%d → %s", i, len(URLS), hotel)
         try:
-            score = get_holidaycheck_score(url, timeout=args.timeout)
+            score = get_holidaycheck_score(url, timeout=args.timeout, session=session, http_cache=http_cache)
         except Exception as exc:
-            logger.error("  %s", exc)
+            logger.error("  %s: %s", hotel, exc)
             score = None
         score = sanitize_holidaycheck_score(score)
-        new_scores[hotel] = score
         if score is not None:
-            logger.info("  %s/6", score)
+            logger.info("  %s: %s/6", hotel, score)
         else:
-            logger.warning("  (no score)")
+            logger.warning("  %s: (no score)", hotel)
+        return score
 
-        # be polite; jitter within [min-delay, max-delay]
-        delay = random.uniform(args.min_delay, args.max_delay)
-        sleep(delay)
+    # I/O-bound: fetches overlap while the throttle keeps the request rate.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        scores = pool.map(fetch_one, enumerate(URLS.items(), start=1))
+        new_scores: dict[str, float | None] = dict(zip(URLS, scores))
 
     # Write column & update average
     df[today_col] = pd.Series(new_scores)
+    if today_col not in df.attrs["date_cols"]:
+        df.attrs["date_cols"].append(today_col)
     update_average(df)
 
     # Save
-    df.to_csv(args.csv, sep=args.sep, index_label="Hotel")
+    save_csv(df, args.csv, args.sep)
     logger.info("Saved %s. Added/updated column: %s", args.csv, today_col)
+    save_json_cache(args.http_cache, http_cache)
 
 
 if __name__ == "__main__":
@@ -103,6 +103,22 @@ def _hotel_url_to_reviews_url(hotel_url: str) -> str:
 
 # ---------------------- HTML scraping ---------------------- #
 
+# Compiled once: the parsers below run for every review on every page.
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DMY_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_YEAR_RE = re.compile(r"(\d{4})")
+_REVIEW_LINK_RE = re.compile(r"/hrd/")
+# Class / data-test filters for the HTML fallback
+_REVIEW_RE = re.compile(r"review", re.I)
+_RATING_RE = re.compile(r"rating", re.I)
+_TITLE_RE = re.compile(r"title", re.I)
+_BODY_CLASS_RE = re.compile(r"review.*text|review.*body|description", re.I)
+_BODY_TEST_RE = re.compile(r"body|text|content", re.I)
+_DATE_RE = re.compile(r"date", re.I)
+_AUTHOR_RE = re.compile(r"author|user", re.I)
+
+
 def _normalize_rating(score: float | None) -> float | None:
     """Normalize a HolidayCheck rating to the 0-6 scale.
 
@@ -121,7 +137,7 @@ def _parse_rating(text: str) -> float | None:
     if not text:
         return None
     cleaned = text.strip().replace(",", ".")
-    m = re.search(r"(\d+(?:\.\d+)?)", cleaned)
+    m = _NUMBER_RE.search(cleaned)
     if m:
         try:
             return float(m.group(1))
@@ -143,11 +159,11 @@ def _parse_date(text: str) -> str:
     text = text.strip()
 
     # ISO format
-    if re.match(r"\d{4}-\d{2}-\d{2}", text):
+    if _ISO_DATE_RE.match(text):
         return text[:10]
 
     # DD.MM.YYYY
-    m = re.match(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
+    m = _DMY_DATE_RE.match(text)
     if m:
         return f"{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"
 
@@ -159,7 +175,7 @@ def _parse_date(text: str) -> str:
     }
     for month_name, month_num in german_months.items():
         if month_name in text.lower():
-            year_m = re.search(r"(\d{4})", text)
+            year_m = _YEAR_RE.search(text)
             if year_m:
                 return f"{year_m.group(1)}-{month_num}-01"
 
@@ -175,7 +191,7 @@ def _extract_review_id_from_element(element: Tag) -> str:
             return str(val)
 
     # Check for links containing /hrd/ with review UUID
-    link = element.find("a", href=re.compile(r"/hrd/"))
+    link = element.find("a", href=_REVIEW_LINK_RE)
     if link:
         href = link.get("href", "")
         parts = href.rstrip("/").split("/")
@@ -231,8 +247,8 @@ def _scrape_reviews_from_html(html: str) -> list[dict]:
     # --- Strategy 2: HTML parsing with common selectors --- #
     # HolidayCheck review containers typically use these patterns
     review_selectors = [
-        {"attrs": {"data-test": re.compile(r"review", re.I)}},
-        {"class_": re.compile(r"review", re.I)},
+        {"attrs": {"data-test": _REVIEW_RE}},
+        {"class_": _REVIEW_RE},
         {"attrs": {"itemtype": "http://schema.org/Review"}},
         {"attrs": {"itemprop": "review"}},
     ]
@@ -293,8 +309,8 @@ def _parse_html_review(element: Tag) -> dict:
     rating = None
     rating_el = (
         element.find(attrs={"itemprop": "ratingValue"})
-        or element.find(class_=re.compile(r"rating", re.I))
-        or element.find(attrs={"data-test": re.compile(r"rating", re.I)})
+        or element.find(class_=_RATING_RE)
+        or element.find(attrs={"data-test": _RATING_RE})
     )
     if rating_el:
         rating = _parse_rating(rating_el.get_text())
@@ -305,7 +321,7 @@ def _parse_html_review(element: Tag) -> dict:
     title = ""
     title_el = (
         element.find(attrs={"itemprop": "name"})
-        or element.find(class_=re.compile(r"title", re.I))
+        or element.find(class_=_TITLE_RE)
         or element.find(["h2", "h3", "h4"])
     )
     if title_el:
@@ -316,8 +332,8 @@ def _parse_html_review(element: Tag) -> dict:
     text_el = (
         element.find(attrs={"itemprop": "reviewBody"})
         or element.find(attrs={"itemprop": "description"})
-        or element.find(class_=re.compile(r"review.*text|review.*body|description", re.I))
-        or element.find(attrs={"data-test": re.compile(r"body|text|content", re.I)})
+        or element.find(class_=_BODY_CLASS_RE)
+        or element.find(attrs={"data-test": _BODY_TEST_RE})
     )
     if text_el:
         text = text_el.get_text(strip=True)
@@ -331,7 +347,7 @@ def _parse_html_review(element: Tag) -> dict:
     travel_date = ""
     date_el = (
         element.find(attrs={"itemprop": "datePublished"})
-        or element.find(class_=re.compile(r"date", re.I))
+        or element.find(class_=_DATE_RE)
         or element.find("time")
     )
     if date_el:
@@ -343,7 +359,7 @@ def _parse_html_review(element: Tag) -> dict:
     author_name = ""
     author_el = (
         element.find(attrs={"itemprop": "author"})
-        or element.find(class_=re.compile(r"author|user", re.I))
+        or element.find(class_=_AUTHOR_RE)
     )
     if author_el:
         author_name = author_el.get_text(strip=True)
@@ -367,7 +383,7 @@ def _extract_review_detail_links(html: str, base_url: str = "https://www.holiday
     links: list[str] = []
     seen: set[str] = set()
 
-    for a_tag in soup.find_all("a", href=re.compile(r"/hrd/")):
+    for a_tag in soup.find_all("a", href=_REVIEW_LINK_RE):
         href = a_tag.get("href", "")
         if not href:
             continue
@@ -37,15 +37,25 @@ from __future__ import annotations
 
 import logging
 import os
-import re
+import sys
 import argparse
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from datetime import datetime
 
 import yaml
 import pandas as pd
 import requests
+from urllib3.util.retry import Retry
+
+if not __package__:
+    # Run as a script (python src/sites/tripadvisor.py): make ``src`` importable.
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from src.sites._common import (
+    DATE_COL_RE, ensure_csv, make_session, save_csv, update_average, load_json_cache, save_json_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,10 +66,15 @@ DEFAULT_CSV = "tripadvisor_scores.csv"
 DEFAULT_CSV_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),  # .../src/sites
     "..", "..", "data", DEFAULT_CSV)
+DEFAULT_RATING_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "data", "tripadvisor_rating_cache.json")
 DEFAULT_SEP = ";"                # you are using semicolon CSV
+RATING_CACHE_TTL = 12 * 3600     # seconds a same-day rating is reused on reruns
 
 DEFAULT_MIN_DELAY = 2.5          # seconds between hotel requests (min)
 DEFAULT_MAX_DELAY = 5.0          # seconds between hotel requests (max)
+DEFAULT_WORKERS = 4              # API requests in flight at once
 
 _CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "hotels.yaml")
 
@@ -71,7 +86,6 @@ def _load_location_ids() -> dict[str, str]:
 # Map of hotel display name -> TripAdvisor location ID
 LOCATION_IDS = _load_location_ids()
 
-DATE_COL_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")  # YYYY-MM-DD
 # -------------------------- Scraper logic -------------------------- #
 
 def sanitize_tripadvisor_score(score: float | None) -> float | None:
@@ -87,13 +101,29 @@ def sanitize_tripadvisor_score(score: float | None) -> float | None:
     return None
 
 
-def ta_get_rating(location_id: str, api_key: str):
+# Detail calls are idempotent GETs, so urllib3 also retries 429/5xx.
+TA_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    # Hand the last response back so raise_for_status reports it.
+    raise_on_status=False,
+)
+
+
+def ta_get_rating(location_id: str, api_key: str, session: requests.Session | None = None):
+    """
+    Rating (0-5) and review count for one location via the details endpoint.
+    Pass ``session`` (see make_session) to reuse connections across hotels.
+    """
     url = f"https://api.content.tripadvisor.com/api/v1/location/{location_id}/details"
     params = {
         "key": api_key,
         "language": "en",
     }
-    resp = requests.get(url, params=params, timeout=15)
+    # (connect, read): a dead host fails fast, a slow answer still gets 15 s.
+    resp = (session or requests).get(url, params=params, timeout=(5, 15))
     logger.debug("Details status: %d", resp.status_code)
     resp.raise_for_status()
     data = resp.json()
@@ -111,39 +141,17 @@ def ta_get_rating(location_id: str, api_key: str):
     return rating, num_reviews
 
 
-# ---------------------------- CSV logic ---------------------------- #
-
-def ensure_csv(csv_path: str, sep: str, hotels: list[str]) -> pd.DataFrame:
-    """
-    Create or load the CSV. Ensure the index includes all hotels and
-    that an 'Average Score' column exists.
+def cached_rating(rating_cache: dict[str, dict], location_id: str, date: str) -> float | None:
     """
-    if not os.path.exists(csv_path):
-        logger.info("Creating %s", csv_path)
-        df = pd.DataFrame(index=hotels)
-        df.index.name = "Hotel"
-        df["Average Score"] = pd.NA
-        df.to_csv(csv_path, sep=sep, index_label="Hotel")
-        return df
-
-    df = pd.read_csv(csv_path, sep=sep, index_col="Hotel")
-    # Make sure all hotels exist as rows
-    for h in hotels:
-        if h not in df.index:
-            df.loc[h] = pd.Series(dtype="float64")
-    if "Average Score" not in df.columns:
-        df["Average Score"] = pd.NA
-    return df
-
-
-def update_average(df: pd.DataFrame) -> None:
+    A rating fetched for the same date column less than RATING_CACHE_TTL ago,
+    so a rerun (e.g. a CI retry) does not spend another paid API call.
     """
-    Recompute 'Average Score' across all columns that look like YYYY-MM-DD.
-    (Non-date columns are ignored.)
-    """
-    date_cols = [c for c in df.columns if isinstance(c, str) and DATE_COL_RE.fullmatch(c)]
-    if date_cols:
-        df["Average Score"] = round(df[date_cols].mean(axis=1, numeric_only=True),2)
+    entry = rating_cache.get(location_id)
+    if not entry or entry.get("date") != date:
+        return None
+    if time.time() - entry.get("fetched_at", 0) > RATING_CACHE_TTL:
+        return None
+    return sanitize_tripadvisor_score(entry.get("rating"))
 
 
 # ----------------------------- CLI main ---------------------------- #
@@ -156,6 +164,10 @@ def parse_args() -> argparse.Namespace:
                    help="Date column to write (YYYY-MM-DD). Default: today.")
     p.add_argument("--min-delay", type=float, default=2.0, help=f"Min delay (s) between hotels (default: 2.0)")
     p.add_argument("--max-delay", type=float, default=5.0, help=f"Max delay (s) between hotels (default: 5.0)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Hotels fetched concurrently (default: {DEFAULT_WORKERS})")
+    p.add_argument("--rating-cache", default=DEFAULT_RATING_CACHE_PATH,
+                   help="Same-day cache of fetched ratings, reused on reruns; '' disables it "
+                        f"(default: {DEFAULT_RATING_CACHE_PATH})")
     return p.parse_args()
 
 
@@ -175,30 +187,52 @@ def main():
     df = ensure_csv(args.csv, args.sep, hotels)
 
     today_col = args.date
-    new_scores: dict[str, float | None] = {}
+    session = make_session(args.workers, TA_RETRY)
+    # location id -> {"date", "fetched_at", "rating", "num_reviews"}. Each
+    # worker touches only its own entry; saved once at the end.
+    rating_cache = load_json_cache(args.rating_cache)
 
     logger.info("Writing scores into column: %s", today_col)
 
-    for i, (hotel, url) in enumerate(LOCATION_IDS.items(), start=1):
+    def fetch_one(item: tuple[int, tuple[str, str]]) -> float | None:
+        i, (hotel, location_id) = item
         logger.info("%02d/%d → %s", i, len(LOCATION_IDS), hotel)
-        score, n = ta_get_rating(url, api_key=api_key)
+        score = cached_rating(rating_cache, location_id, today_col)
+        if score is not None:
+            logger.info("  %s: %s/5 (cached)", hotel, score)
+            return score
+
+        # be polite; each worker waits [min-delay, max-delay] before its request
+        sleep(random.uniform(args.min_delay, args.max_delay))
+        score, n = ta_get_rating(location_id, api_key=api_key, session=session)
         score = sanitize_tripadvisor_score(score)
-        new_scores[hotel] = score
         if score is not None:
-            logger.info("  %s/5", score)
+            rating_cache[location_id] = {
+                "date": today_col, "fetched_at": time.time(), "rating": score, "num_reviews": n,
+            }
+            logger.info("  %s: %s/5", hotel, score)
         else:
-            logger.warning("  (no score)")
+            logger.warning("  %s: (no score)", hotel)
+        return score
 
-        # be polite; jitter within [min-delay, max-delay]
-        delay = random.uniform(args.min_delay, args.max_delay)
-        sleep(delay)
+    # I/O-bound: up to --workers detail requests overlap; results keep the
+    # configured hotel order. An API error still aborts the run, as before.
+    # The cache is saved even then, so the retry only fetches what is missing.
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            scores = pool.map(fetch_one, enumerate(LOCATION_IDS.items(), start=1))
+            new_scores: dict[str, float | None] = dict(zip(LOCATION_IDS, scores))
+    finally:
+        save_json_cache(args.rating_cache, rating_cache)
 
     # Write column & update average
     df[today_col] = pd.Series(new_scores)
+    if today_col not in df.attrs["date_cols"]:
+        df.attrs["date_cols"].append(today_col)
     update_average(df)
 
     # Save
-    df.to_csv(args.csv, sep=args.sep, index_label="Hotel")
+    save_csv(df, args.csv, args.sep)
     logger.info("Saved %s. Added/updated column: %s", args.csv, today_col)
 
 if __name__ == "__main__":
@@ -1,13 +1,24 @@
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def load_config(path: Path):
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Parsed YAML config, re-read only once the file's mtime changes.
+    The result is shared between callers: treat it as read-only."""
+    path = Path(path)
+    return _load_config_cached(path, path.stat().st_mtime_ns)
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: Path, mtime_ns: int):
+    # Bytes: both loaders detect the encoding, and libyaml skips a decode.
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_Loader)
 
 def hotels_list(cfg) -> list[str]:
     return [h["name"] for h in cfg["hotels"]]
 
 def websites(cfg) -> list[str]:
     return [w.upper() for w in cfg.get("websites", [])]
-
@@ -1,3 +1,5 @@
+import io
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -39,6 +41,8 @@ def _make_session(html: str, status_code: int = 200) -> MagicMock:
     resp = MagicMock()
     resp.status_code = status_code
     resp.text = html
+    resp.encoding = "utf-8"
+    resp.iter_content = lambda chunk_size: iter([html.encode("utf-8")])
     resp.raise_for_status = MagicMock()
     session = MagicMock()
     session.get.return_value = resp
@@ -72,6 +76,48 @@ def test_fetch_rating_from_jsonld_list() -> None:
     assert fetch_booking_rating("https://example.com", session, retries=0) == 9.2
 
 
+def test_fetch_rating_skips_blocks_without_aggregate_rating() -> None:
+    html = """
+    <html><head>
+    <script type="application/ld+json">{"@type":"BreadcrumbList","itemListElement":[]}</script>
+    <script type="application/ld+json">{"aggregateRating":{"ratingValue":"8.1"}}</script>
+    </head></html>
+    """
+    session = _make_session(html)
+    with patch("src.sites.booking.json.loads", wraps=json.loads) as loads:
+        assert fetch_booking_rating("https://example.com", session, retries=0) == 8.1
+    # The flat rating object is read by regex, so nothing is JSON-decoded.
+    assert loads.call_count == 0
+
+
+def test_fetch_rating_nested_rating_falls_back_to_json() -> None:
+    html = """
+    <html><head>
+    <script type="application/ld+json">
+    {"aggregateRating":{"ratingValue":{"@value":"7.9"}},
+     "containsPlace":{"aggregateRating":{"ratingValue":"8.4"}}}
+    </script>
+    </head></html>
+    """
+    session = _make_session(html)
+    with patch("src.sites.booking.sleep"):
+        # json.loads path: the top-level ratingValue is not a number.
+        assert fetch_booking_rating("https://example.com", session, retries=0) is None
+
+
+def test_fetch_rating_does_not_build_a_dom_for_plain_jsonld() -> None:
+    html = """
+    <html><head>
+    <script data-x="1" type='application/ld+json'>
+    {"@type":"Hotel","aggregateRating":{"ratingValue":"8.9","bestRating":"10"}}
+    </script>
+    </head></html>
+    """
+    session = _make_session(html)
+    with patch("src.sites.booking.BeautifulSoup", side_effect=AssertionError("DOM built")):
+        assert fetch_booking_rating("https://example.com", session, retries=0) == 8.9
+
+
 def test_fetch_rating_comma_decimal_separator() -> None:
     html = """
     <html><head>
@@ -90,6 +136,23 @@ def test_fetch_rating_no_aggregate_rating_returns_none() -> None:
     assert fetch_booking_rating("https://example.com", session, retries=0) is None
 
 
+def test_fetch_rating_page_without_rating_is_retried_then_none() -> None:
+    html = "<html><head></head><body>No rating here</body></html>"
+    session = _make_session(html)
+    with patch("src.sites.booking.sleep") as sleep_mock:
+        assert fetch_booking_rating("https://example.com", session, retries=2) is None
+    assert session.get.call_count == 3
+    assert sleep_mock.call_count == 2
+
+
+def test_fetch_rating_304_without_cache_entry_is_retried_then_none() -> None:
+    session = _make_session("", status_code=304)
+    with patch("src.sites.booking.sleep") as sleep_mock:
+        assert fetch_booking_rating("https://example.com", session, retries=1, http_cache={}) is None
+    assert session.get.call_count == 2
+    sleep_mock.assert_called_once()
+
+
 def test_fetch_rating_malformed_jsonld_skipped() -> None:
     html = """
     <html><head>
@@ -109,3 +172,64 @@ def test_fetch_rating_http_error_returns_none() -> None:
     # retries=0 so only one attempt; should catch the exception and return None
     with patch("src.sites.booking.sleep"):
         assert fetch_booking_rating("https://example.com", session, retries=0) is None
+
+
+def _http_error_response(status_code: int, headers: dict | None = None):
+    import requests as req
+    resp = req.Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    resp.url = "https://example.com"
+    resp.raw = io.BytesIO(b"")
+    return resp
+
+
+def test_fetch_rating_client_error_is_not_retried() -> None:
+    session = MagicMock()
+    session.get.return_value = _http_error_response(404)
+    with patch("src.sites.booking.sleep") as sleep_mock:
+        assert fetch_booking_rating("https://example.com", session, retries=2) is None
+    assert session.get.call_count == 1
+    sleep_mock.assert_not_called()
+
+
+def test_fetch_rating_honours_retry_after_on_429() -> None:
+    ok = _make_session(
+        '<script type="application/ld+json">{"aggregateRating":{"ratingValue":"8.5"}}</script>'
+    ).get.return_value
+    session = MagicMock()
+    session.get.side_effect = [_http_error_response(429, {"Retry-After": "7"}), ok]
+    with patch("src.sites.booking.sleep") as sleep_mock, \
+            patch("src.sites.booking.random.random", return_value=0.5):
+        assert fetch_booking_rating("https://example.com", session, retries=2) == 8.5
+    sleep_mock.assert_called_once_with(7.5)
+
+
+def test_fetch_rating_stops_reading_once_rating_is_received() -> None:
+    head = '<head><script type="application/ld+json">{"aggregateRating":{"ratingValue":"8.3"}}</script>'
+
+    def chunks(chunk_size):
+        yield head[:30].encode()
+        yield head[30:].encode()
+        raise AssertionError("read past the rating")
+
+    session = _make_session(head)
+    session.get.return_value.iter_content = chunks
+    assert fetch_booking_rating("https://example.com", session, retries=0) == 8.3
+    session.get.return_value.close.assert_called_once()
+
+
+def test_fetch_rating_stores_validators_and_reuses_score_on_304() -> None:
+    url = "https://www.booking.com/hotel/pt/example"
+    html = '<script type="application/ld+json">{"aggregateRating":{"ratingValue":"8.7"}}</script>'
+    session = _make_session(html)
+    session.get.return_value.headers = {"ETag": '"abc"'}
+    cache: dict = {}
+    assert fetch_booking_rating(url, session, retries=0, http_cache=cache) == 8.7
+    assert cache[url] == {"etag": '"abc"', "last_modified": None, "score": 8.7}
+
+    not_modified = _make_session("", status_code=304)
+    not_modified.get.return_value.iter_content = MagicMock()
+    assert fetch_booking_rating(url, not_modified, retries=0, http_cache=cache) == 8.7
+    assert not_modified.get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+    not_modified.get.return_value.iter_content.assert_not_called()
@@ -0,0 +1,113 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from src.sites._common import (
+    HostThrottle, body_encoding, conditional_headers, ensure_csv, load_json_cache, make_session,
+    remember_validators, save_csv, save_json_cache, update_average,
+)
+
+
+def test_ensure_csv_appends_missing_hotels_in_file_order(tmp_path: Path) -> None:
+    csv_path = tmp_path / "scores.csv"
+    csv_path.write_text(
+        "Hotel;Average Score;2026-02-12;Note\n"
+        "B;8.0;8.0;x\n"
+        "A;7.0;7.0;\n",
+        encoding="utf-8",
+    )
+    df = ensure_csv(str(csv_path), ";", ["A", "C", "B", "D"])
+    assert list(df.index) == ["B", "A", "C", "D"]
+    assert df.index.name == "Hotel"
+    assert df.attrs["date_cols"] == ["2026-02-12"]
+    assert df.loc[["C", "D"], "2026-02-12"].isna().all()
+
+
+def test_ensure_csv_new_file_is_not_written_until_main_saves(tmp_path: Path) -> None:
+    csv_path = tmp_path / "scores.csv"
+    df = ensure_csv(str(csv_path), ";", ["A", "B"])
+    assert list(df.index) == ["A", "B"]
+    assert df.attrs["date_cols"] == []
+    assert not csv_path.exists()
+
+
+def test_update_average_uses_tracked_date_columns(tmp_path: Path) -> None:
+    csv_path = tmp_path / "scores.csv"
+    csv_path.write_text("Hotel;2026-02-12\nA;8.0\nB;\n", encoding="utf-8")
+    df = ensure_csv(str(csv_path), ";", ["A", "B"])
+    df["2026-02-26"] = [9.25, 7.0]
+    df.attrs["date_cols"].append("2026-02-26")
+    update_average(df)
+    assert df["Average Score"].tolist() == [8.62, 7.0]
+
+
+def test_save_csv_keeps_the_old_file_when_the_write_fails(tmp_path: Path) -> None:
+    csv_path = tmp_path / "scores.csv"
+    csv_path.write_text("Hotel;2026-02-12\nA;8.0\n", encoding="utf-8")
+    df = ensure_csv(str(csv_path), ";", ["A"])
+    df["2026-02-26"] = [9.0]
+    def torn_write(path, **kwargs):
+        Path(path).write_text("Hotel;20", encoding="utf-8")
+        raise OSError("disk full")
+
+    with patch.object(type(df), "to_csv", side_effect=torn_write):
+        with pytest.raises(OSError):
+            save_csv(df, str(csv_path), ";")
+    assert csv_path.read_text(encoding="utf-8") == "Hotel;2026-02-12\nA;8.0\n"
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+    save_csv(df, str(csv_path), ";")
+    assert csv_path.read_text(encoding="utf-8").splitlines()[0] == "Hotel;2026-02-12;Average Score;2026-02-26"
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+def test_host_throttle_spaces_same_host_only() -> None:
+    throttle = HostThrottle(2.0, 2.0)
+    with patch("src.sites._common.time.monotonic", return_value=100.0), \
+            patch("src.sites._common.sleep") as sleep_mock:
+        throttle.wait("https://www.booking.com/hotel/a.html")
+        throttle.wait("https://www.expedia.com/hotel/b.html")
+        throttle.wait("https://www.booking.com/hotel/c.html")
+        throttle.wait("https://www.booking.com/hotel/d.html")
+    assert [c.args[0] for c in sleep_mock.call_args_list] == [2.0, 4.0]
+
+
+def test_make_session_sizes_the_pool_and_only_retries_connects_by_default() -> None:
+    adapter = make_session(6).get_adapter("https://www.booking.com/")
+    assert adapter._pool_maxsize == 6
+    assert adapter.max_retries.connect == 2
+    assert adapter.max_retries.status == 0
+
+
+def test_body_encoding_uses_declared_charset_else_utf8() -> None:
+    declared = MagicMock(headers=CaseInsensitiveDict({"Content-Type": "text/html; charset=windows-1252"}), encoding="windows-1252")
+    bare = MagicMock(headers=CaseInsensitiveDict({"Content-Type": "text/html"}), encoding="ISO-8859-1")
+    assert body_encoding(declared) == "windows-1252"
+    assert body_encoding(bare) == "utf-8"
+
+
+def test_conditional_headers_add_validators_to_base_headers() -> None:
+    cached = {"etag": '"abc"', "last_modified": "Wed, 01 Oct 2026 06:00:00 GMT", "score": 8.7}
+    assert conditional_headers(cached, {"Accept": "text/html"}) == {
+        "Accept": "text/html",
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Oct 2026 06:00:00 GMT",
+    }
+    assert conditional_headers(None, {"Accept": "text/html"}) == {"Accept": "text/html"}
+
+
+def test_remember_validators_round_trips_through_the_json_cache(tmp_path: Path) -> None:
+    path = tmp_path / "http_cache.json"
+    cache = load_json_cache(str(path))
+    assert cache == {}
+    resp = MagicMock(headers=CaseInsensitiveDict({"ETag": '"abc"'}))
+    remember_validators(cache, "https://example.com/a", resp, 8.7)
+    save_json_cache(str(path), cache)
+
+    reloaded = load_json_cache(str(path))
+    assert reloaded == {"https://example.com/a": {"etag": '"abc"', "last_modified": None, "score": 8.7}}
+    # A page that stops sending validators is dropped rather than kept stale.
+    remember_validators(reloaded, "https://example.com/a", MagicMock(headers=CaseInsensitiveDict()), 8.9)
+    assert reloaded == {}
@@ -1,6 +1,12 @@
+from unittest.mock import MagicMock, patch
+
 from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
 
 from src.sites.expedia import (
+    SessionPool,
+    fetch_page,
+    get_expedia_score,
     _expedia_url_candidates,
     _extract_embedded_json_score,
     _extract_jsonld_score,
@@ -20,11 +26,50 @@ def test_extract_jsonld_score() -> None:
     assert _extract_jsonld_score(soup) == 8.6
 
 
+def test_extract_jsonld_score_walks_graph_and_prefers_the_hotel() -> None:
+    html = """
+    <script type="application/ld+json">
+    {"@graph":[
+      {"@type":"Review","aggregateRating":{"ratingValue":9.8}},
+      {"@type":"Hotel","aggregateRating":{"ratingValue":"8,4","bestRating":"10","reviewCount":"1200"},
+       "starRating":{"ratingValue":"4"}}
+    ]}
+    </script>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    assert _extract_jsonld_score(soup) == 8.4
+
+
+def test_extract_jsonld_score_matches_the_key_in_any_case() -> None:
+    html = """
+    <script type="application/ld+json">
+    {"@type":"Hotel","AggregateRating":{"RatingValue":"8.7","BestRating":"10"}}
+    </script>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    assert _extract_jsonld_score(soup) == 8.7
+
+
+def test_extract_jsonld_score_falls_back_to_regex_for_invalid_json() -> None:
+    html = """
+    <script type="application/ld+json">
+    {"aggregateRating":{"ratingValue":"8.2","bestRating":"10"}, "name": "{{ hotel.name }}
+    </script>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    assert _extract_jsonld_score(soup) == 8.2
+
+
 def test_extract_textual_score() -> None:
     text = "Guest rating 8.6 out of 10 Excellent"
     assert _extract_textual_score(text) == 8.6
 
 
+def test_extract_textual_score_prefers_out_of_10_over_earlier_slash() -> None:
+    text = "Cleanliness 9.4/10 Guest rating 8.6 out of 10"
+    assert _extract_textual_score(text) == 8.6
+
+
 def test_extract_embedded_json_score() -> None:
     html = '<script>window.__DATA__={"reviewScoreWithDescription":"8.6 Very good"};</script>'
     assert _extract_embedded_json_score(html) == 8.6
@@ -53,3 +98,62 @@ def test_expedia_url_candidates_include_host_and_query_fallbacks() -> None:
     assert any("www.expedia.com" in c for c in candidates)
     assert any("www.expedia.co.uk" in c for c in candidates)
     assert any("foo=bar" in c and "pwaDialog" not in c for c in candidates)
+
+
+def test_session_pool_skips_sessions_marked_bad() -> None:
+    pool = SessionPool(["ua-a", "ua-b"])
+    first = pool.get_session()
+    assert first.headers["User-Agent"] == "ua-a"
+    pool.mark_bad(first)
+    assert [pool.get_session().headers["User-Agent"] for _ in range(3)] == ["ua-b"] * 3
+    pool.mark_good(first)
+    assert {pool.get_session() for _ in range(2)} == set(pool._sessions)
+
+
+def test_session_pool_sizes_each_session_for_the_workers() -> None:
+    pool = SessionPool(["ua-a", "ua-b"], pool_maxsize=8)
+    assert all(s.get_adapter("https://www.expedia.com/")._pool_maxsize == 8 for s in pool._sessions)
+
+
+def test_fetch_page_reads_at_most_max_bytes() -> None:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.encoding = "utf-8"
+    resp.iter_content = MagicMock(return_value=iter([b"a" * 10, b"b" * 10, b"c" * 10]))
+    session = MagicMock()
+    session.get.return_value = resp
+    with patch("src.sites.expedia.SessionPool.get_session", return_value=session):
+        html = fetch_page("https://www.expedia.com/h1.Hotel-Information", timeout=5, retries=0, max_bytes=15)
+    assert html == "a" * 10 + "b" * 5
+    assert session.get.call_args.kwargs["stream"] is True
+    resp.close.assert_called_once()
+
+
+def test_fetch_page_decodes_charsetless_html_as_utf8() -> None:
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = CaseInsensitiveDict({"Content-Type": "text/html"})
+    resp.encoding = "ISO-8859-1"  # what requests reports without a charset
+    resp.iter_content = MagicMock(return_value=iter(["Hôtel é".encode("utf-8")]))
+    session = MagicMock()
+    session.get.return_value = resp
+    with patch("src.sites.expedia.SessionPool.get_session", return_value=session):
+        html = fetch_page("https://www.expedia.com/h1.Hotel-Information", timeout=5, retries=0)
+    assert html == "Hôtel é"
+
+
+def test_get_expedia_score_reuses_cached_score_on_304() -> None:
+    url = "https://www.expedia.com/h1.Hotel-Information"
+    html = '<div class="uitk-text uitk-type-900 uitk-text-default-theme">8.4</div>'
+    fresh = MagicMock(status_code=200, encoding="utf-8", headers={"ETag": '"v1"'})
+    fresh.iter_content = MagicMock(return_value=iter([html.encode("utf-8")]))
+    not_modified = MagicMock(status_code=304, headers={})
+    session = MagicMock()
+    session.get.side_effect = [fresh, not_modified]
+    cache: dict = {}
+    with patch("src.sites.expedia.SessionPool.get_session", return_value=session):
+        assert get_expedia_score(url, timeout=5, retries=0, http_cache=cache) == 8.4
+        assert cache[url]["score"] == 8.4
+        assert get_expedia_score(url, timeout=5, retries=0, http_cache=cache) == 8.4
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    not_modified.iter_content.assert_not_called()
@@ -1,6 +1,6 @@
 from unittest.mock import MagicMock, patch
 
-from src.sites.google import sanitize_google_score, get_google_rating
+from src.sites.google import sanitize_google_score, get_google_rating, get_place_rating, search_place
 
 
 # ── sanitize_google_score ─────────────────────────────────────────────────────
@@ -75,3 +75,20 @@ def test_get_rating_uses_first_place_only() -> None:
     with patch("src.sites.google.requests.post", return_value=_mock_post(places)):
         result = get_google_rating("Hotel", api_key="test-key")
     assert result == 3.9
+
+
+# ── place ids ─────────────────────────────────────────────────────────────────
+
+def test_search_place_returns_first_place_with_its_id() -> None:
+    places = [{"id": "abc", "rating": 4.3}, {"id": "def", "rating": 3.0}]
+    with patch("src.sites.google.requests.post", return_value=_mock_post(places)):
+        assert search_place("Some Hotel, Portugal", api_key="test-key")["id"] == "abc"
+
+
+def test_get_place_rating_uses_place_details() -> None:
+    resp = MagicMock()
+    resp.json.return_value = {"rating": 4.6, "userRatingCount": 812}
+    with patch("src.sites.google.requests.get", return_value=resp) as mock_get:
+        assert get_place_rating("abc", api_key="test-key") == 4.6
+    assert mock_get.call_args.args[0] == "https://places.googleapis.com/v1/places/abc"
+    assert mock_get.call_args.kwargs["headers"]["X-Goog-FieldMask"] == "rating,userRatingCount"
@@ -96,6 +96,15 @@ def test_get_score_fallback_text_pattern() -> None:
         assert get_holidaycheck_score("https://example.com") == 4.5
 
 
+def test_get_score_fallback_reads_visible_text_only() -> None:
+    html = (
+        '<html><head><script>var build = "1.2/6";</script></head><body>'
+        '<a href="/img/3.4/600.jpg">Photos</a> Overall <b>5,1</b>&nbsp;/&nbsp;6</body></html>'
+    )
+    with patch("src.sites.holidaycheck.requests.get", return_value=_make_response(html)):
+        assert get_holidaycheck_score("https://example.com") == 5.1
+
+
 def test_get_score_no_rating_returns_none() -> None:
     html = "<html><body>No score here</body></html>"
     with patch("src.sites.holidaycheck.requests.get", return_value=_make_response(html)):
@@ -107,3 +116,30 @@ def test_get_score_empty_url_returns_none() -> None:
         result = get_holidaycheck_score("")
     assert result is None
     mock_get.assert_not_called()
+
+
+def test_get_score_uses_the_given_session() -> None:
+    html = '<script type="application/ld+json">{"aggregateRating":{"ratingValue":"5.4","bestRating":"6"}}</script>'
+    session = MagicMock()
+    session.get.return_value = _make_response(html)
+    with patch("src.sites.holidaycheck.requests.get") as mock_get:
+        assert get_holidaycheck_score("https://example.com", session=session) == 5.4
+    mock_get.assert_not_called()
+    session.get.assert_called_once()
+
+
+def test_get_score_reuses_cached_score_on_304() -> None:
+    url = "https://www.holidaycheck.de/hi/example"
+    html = '<script type="application/ld+json">{"aggregateRating":{"ratingValue":"5.4","bestRating":"6"}}</script>'
+    fresh = _make_response(html)
+    fresh.status_code = 200
+    fresh.headers = {"Last-Modified": "Wed, 01 Oct 2026 10:00:00 GMT"}
+    cache: dict = {}
+    with patch("src.sites.holidaycheck.requests.get", return_value=fresh):
+        assert get_holidaycheck_score(url, http_cache=cache) == 5.4
+
+    not_modified = _make_response("")
+    not_modified.status_code = 304
+    with patch("src.sites.holidaycheck.requests.get", return_value=not_modified) as mock_get:
+        assert get_holidaycheck_score(url, http_cache=cache) == 5.4
+    assert mock_get.call_args.kwargs["headers"]["If-Modified-Since"] == "Wed, 01 Oct 2026 10:00:00 GMT"
@@ -32,6 +32,8 @@ def test_booking_full_pipeline() -> None:
     resp = MagicMock()
     resp.status_code = 200
     resp.text = BOOKING_HTML
+    resp.encoding = "utf-8"
+    resp.iter_content = lambda chunk_size: iter([BOOKING_HTML.encode("utf-8")])
     resp.raise_for_status = MagicMock()
     session = MagicMock()
     session.get.return_value = resp
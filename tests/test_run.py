@@ -1,7 +1,13 @@
+import json
+import threading
+import time
 from pathlib import Path
 from subprocess import CompletedProcess
 
-from src.run import SiteConfig, normalize_sites, run_site, validate_site_csv
+import pandas as pd
+import pytest
+
+from src.run import SiteConfig, SiteResult, main, normalize_sites, run_site, validate_site_csv
 
 
 def test_normalize_sites_uppercases_and_filters_empty() -> None:
@@ -50,6 +56,33 @@ def test_validate_site_csv_counts_scored_rows(tmp_path: Path) -> None:
     assert total == 3
 
 
+def test_validate_site_csv_handles_blank_and_ragged_rows(tmp_path: Path) -> None:
+    csv_path = tmp_path / "scores.csv"
+    csv_path.write_text(
+        "Hotel;Average Score;2026-02-13\n"
+        "A;4.5;  \n"
+        "B;4.0\n"
+        "C;3.8;3.8;extra\n",
+        encoding="utf-8",
+    )
+
+    assert validate_site_csv(csv_path, "2026-02-13") == (True, True, 1, 3)
+    assert validate_site_csv(csv_path, "2026-02-14") == (True, False, 0, 3)
+
+
+def test_validate_site_csv_reads_parquet(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "scores.parquet"
+    pd.DataFrame({
+        "Hotel": ["A", "B", "C"],
+        "Average Score": [4.5, 4.0, 3.8],
+        "2026-02-13": [4.5, None, 3.8],
+    }).to_parquet(path, index=False)
+
+    assert validate_site_csv(path, "2026-02-13") == (True, True, 2, 3)
+    assert validate_site_csv(path, "2026-02-14") == (True, False, 0, 3)
+
+
 def test_run_site_warns_when_no_scores_collected(tmp_path: Path, monkeypatch) -> None:
     csv_path = tmp_path / "scores.csv"
     csv_path.write_text(
@@ -121,3 +154,28 @@ def test_run_site_is_ok_when_all_scores_collected(tmp_path: Path, monkeypatch) -
     assert result.status == "ok"
     assert result.warning is False
     assert result.message == "Collected scores for 2/2 hotels"
+
+
+def test_main_runs_sites_in_parallel_and_keeps_order(tmp_path: Path, monkeypatch) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_run_site(site, config, date_col, python_cmd, timeout):
+        if site == "BOOKING":
+            time.sleep(0.05)
+        barrier.wait()  # only passes if both sites run at the same time
+        return SiteResult(
+            site=site, status="ok", message="", warning=False, returncode=0,
+            duration_seconds=0.0, csv_path=str(config.csv_path),
+            has_date_column=True, scored_hotels=1, total_hotels=1,
+        )
+
+    summary = tmp_path / "summary.json"
+    monkeypatch.setattr("src.run.run_site", fake_run_site)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["run.py", "--sites", "booking", "google", "--date", "2026-02-13", "--summary-json", str(summary)],
+    )
+
+    assert main() == 0
+    data = json.loads(summary.read_text(encoding="utf-8"))
+    assert [r["site"] for r in data["results"]] == ["BOOKING", "GOOGLE"]
@@ -0,0 +1,24 @@
+from unittest.mock import patch
+
+from src.sites.tripadvisor import RATING_CACHE_TTL, cached_rating
+
+
+# ── cached_rating ─────────────────────────────────────────────────────────────
+
+def test_cached_rating_hit_for_same_date_within_ttl() -> None:
+    cache = {"123": {"date": "2026-02-26", "fetched_at": 1000.0, "rating": 4.5, "num_reviews": 80}}
+    with patch("src.sites.tripadvisor.time.time", return_value=1000.0 + RATING_CACHE_TTL - 1):
+        assert cached_rating(cache, "123", "2026-02-26") == 4.5
+
+
+def test_cached_rating_expired_ttl_is_a_miss() -> None:
+    cache = {"123": {"date": "2026-02-26", "fetched_at": 1000.0, "rating": 4.5, "num_reviews": 80}}
+    with patch("src.sites.tripadvisor.time.time", return_value=1000.0 + RATING_CACHE_TTL + 1):
+        assert cached_rating(cache, "123", "2026-02-26") is None
+
+
+def test_cached_rating_other_date_or_location_is_a_miss() -> None:
+    cache = {"123": {"date": "2026-02-26", "fetched_at": 1000.0, "rating": 4.5, "num_reviews": 80}}
+    with patch("src.sites.tripadvisor.time.time", return_value=1000.0):
+        assert cached_rating(cache, "123", "2026-02-27") is None
+        assert cached_rating(cache, "456", "2026-02-26") is None